@@ -7,8 +7,8 @@
 #--------------------------
 
 pt_gas_ccgt = prm_tech()
-pt_gas_ccgt.set_isPvar({y: True for y in years}) # Capacity is endogeneous
-pt_gas_ccgt.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours}) # Energy is endogeneous
+pt_gas_ccgt.set_isPvar(True) # Capacity is endogeneous
+pt_gas_ccgt.set_isEvar(True) # Energy is endogeneous
 
 pt_gas_ccgt.set_A({(y,w): 0.8 for y in years for w in weeks}) # Availability factor
 
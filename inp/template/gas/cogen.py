@@ -3,7 +3,9 @@
 ############################
 
 
-if len(sys.argv) > 1:
+if globals().get('profile_path'):   # Profile given by TechnoLoader
+    arg = profile_path
+elif len(sys.argv) > 1:
     arg = sys.argv[1]
 else:
     print("No argument provided for won.py... Please provide a path.")
@@ -14,8 +16,8 @@ else:
 #--------------------------
 
 pt_gas_cogen = prm_tech()
-pt_gas_cogen.set_isPvar({y: False for y in years}) # Capacity is endogeneous
-pt_gas_cogen.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours}) # Energy is endogeneous
+pt_gas_cogen.set_isPvar(False) # Capacity is endogeneous
+pt_gas_cogen.set_isEvar(True) # Energy is endogeneous
 
 # Source : https://assets.rte-france.com/analyse-et-donnees/2023-11/2023-10-16-chapitre3-production-stockage-electricite.pdf 
 data_P_years = [2020 , 2030 , 2045 , 2050]
@@ -26,21 +28,22 @@ pt_gas_cogen.set_P(data_P,data_P_years)
 #--------------------------
 # Weeks managment
 #--------------------------
-if profil_weeks == 'average' or  profil_weeks == "M4" :
+if profil_weeks == 'average' or  profil_weeks == "M4" or profil_weeks == 'kmedoids' :
     
     cogen_lf_average = lake_lf_reshape.groupby(group).mean()
-    dict_cogen_lf = {(y,w,h): lake_lf_average.iloc[w-1, h-1] for y in years for w in weeks for h in hours}
+    dict_cogen_lf = series_profile(years, weeks, hours, lake_lf_average.to_numpy())
 
 elif profil_weeks == 'maxmin':
     print('Not yet implemented ... EXIT(1)')
     exit()
 
-pt_gas_cogen.set_LF(copy.deepcopy(dict_lake_lf))
+pt_gas_cogen.set_LF(dict_lake_lf)
 
 # Energy
-pt_gas_cogen.set_isEvar({(y,w,h): False for y in years for w in weeks for h in hours})
-E = {(y,w,h): pt_gas_cogen.get_P()[y] * dict_cogen_lf[y,w,h] for y in years for w in weeks for h in hours}
-pt_gas_cogen.set_E(copy.deepcopy(E))
+pt_gas_cogen.set_isEvar(False)
+P_cogen = np.array([pt_gas_cogen.get_P()[y] for y in years])
+E = dict_cogen_lf.scaled(P_cogen)
+pt_gas_cogen.set_E(E)
 
 # CO2 emission rate - g/kWh
 # CINEASTE/data/source/annexes_rappor_2050_RTE/Chapitre 11, p 944
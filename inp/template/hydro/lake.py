@@ -2,7 +2,9 @@
 # HYDRO - LAKE
 ############################
 
-if len(sys.argv) > 1:
+if globals().get('profile_path'):   # Profile given by TechnoLoader
+    arg = profile_path
+elif len(sys.argv) > 1:
     arg = sys.argv[1]
 else:
     print("No argument provided for won.py... Please provide a path.")
@@ -14,7 +16,7 @@ else:
 
 pt_hydro_lake = prm_tech()
 
-pt_hydro_lake.set_isPvar({y: False for y in years})
+pt_hydro_lake.set_isPvar(False)
 
 #Source :  Panorama des energies renouvelables dec 2023 - ORE - ENEDIS - RTE - SER
 pt_hydro_lake.set_P(13610)
@@ -24,15 +26,15 @@ pt_hydro_lake.set_P(13610)
 #dict_lake_lf = {(y,h): lake_lf[h-1] for y in years for h in hours}
 #pt_hydro_lake.set_LF(copy.deepcopy(dict_lake_lf))
 
-# Get 52 weeks of data
-lake_lf = np.loadtxt(arg).tolist()[:int(7*24*52)]
+# Get the periods of data (period_length hours x number_of_periods)
+lake_lf = load_profile(arg, period_length*number_of_periods)
 # Build dataframe with matrix form
-lake_lf_reshape = pd.DataFrame(np.array(lake_lf).reshape(-1, 7 * 24))
+lake_lf_reshape = pd.DataFrame(reshape_periods(lake_lf, period_length, number_of_periods))
 
 #--------------------------
 # Weeks managment
 #--------------------------
-if profil_weeks == 'average' or  profil_weeks == "M4" :
+if profil_weeks == 'average' or  profil_weeks == "M4" or profil_weeks == 'kmedoids' :
     # Select a random index from the filtered indices
     #    lake_lf_random = pd.DataFrame()
     #    dict_lake_lf={}
@@ -45,18 +47,20 @@ if profil_weeks == 'average' or  profil_weeks == "M4" :
     #        dict_lake_lf={**dict_lake_lf,**dict_lake_lf_local}
 
     lake_lf_average = lake_lf_reshape.groupby(group).mean()
-    dict_lake_lf = {(y,w,h): lake_lf_average.iloc[w-1, h-1] for y in years for w in weeks for h in hours}
+    # Same average week for every year: stored once, as a year-invariant profile
+    dict_lake_lf = series_profile(years, weeks, hours, lake_lf_average.to_numpy())
 
 elif profil_weeks == 'maxmin':
     print('Not yet implemented ... EXIT(1)')
     exit()
 
-pt_hydro_lake.set_LF(copy.deepcopy(dict_lake_lf))
+pt_hydro_lake.set_LF(dict_lake_lf)
 
-# Energy
-pt_hydro_lake.set_isEvar({(y,w,h): False for y in years for w in weeks for h in hours})
-E = {(y,w,h): pt_hydro_lake.get_P()[y] * dict_lake_lf[y,w,h] for y in years for w in weeks for h in hours}
-pt_hydro_lake.set_E(copy.deepcopy(E))
+# Energy (exogenous) : E[y,w,h] = P[y] * LF[w,h], kept as base profile x per-year scale
+pt_hydro_lake.set_isEvar(False)
+P_lake = np.array([pt_hydro_lake.get_P()[y] for y in years])
+E = dict_lake_lf.scaled(P_lake)
+pt_hydro_lake.set_E(E)
 
 #--------------------------
 # Economical parameters
@@ -2,7 +2,9 @@
 # HYDRO - ROR
 ############################
 
-if len(sys.argv) > 1:
+if globals().get('profile_path'):   # Profile given by TechnoLoader
+    arg = profile_path
+elif len(sys.argv) > 1:
     arg = sys.argv[1]
 else:
     print("No argument provided for won.py... Please provide a path.")
@@ -14,7 +16,7 @@ else:
 
 pt_hydro_ror = prm_tech()
 
-pt_hydro_ror.set_isPvar({y: False for y in years})
+pt_hydro_ror.set_isPvar(False)
 
 # Source :  Panorama des energies renouvelables dec 2023 - ORE - ENEDIS - RTE - SER
 pt_hydro_ror.set_P(6678)
@@ -24,69 +26,34 @@ pt_hydro_ror.set_P(6678)
 #dict_ror_lf = {(y,h): ror_lf[h-1] for y in years for h in hours}
 #pt_hydro_ror.set_LF(copy.deepcopy(dict_ror_lf))
 
-# Get 52 weeks of data
-ror_lf = np.loadtxt(arg).tolist()[:int(7*24*52)]
+# Get the periods of data (period_length hours x number_of_periods)
+ror_lf = load_profile(arg, period_length*number_of_periods)
 # Build dataframe with matrix form
-ror_lf_reshape = pd.DataFrame(np.array(ror_lf).reshape(-1, 7 * 24))
+ror_lf_reshape = pd.DataFrame(reshape_periods(ror_lf, period_length, number_of_periods))
 
 #--------------------------
 # Weeks managment
 #--------------------------
 
-if profil_weeks == 'average' or  profil_weeks == "M4" :
-    # Select a random index from the filtered indices
-    ror_lf_new = pd.DataFrame()
-    dict_ror_lf={}
-    for y in years :
-        ror_lf_new = pd.DataFrame()
-        for w in range(number_of_mean_weeks):
-
-            # A random week inside each groups of the representative weeks is used
-            if loadfactor_ror == 'random':
-                ror_lf_new = pd.concat([ror_lf_new, pd.DataFrame([ror_lf_reshape.iloc[random.choice(np.where(group == w)[0])]])], ignore_index=True)
-            
-            # The maximum Load Factor of the week inside each groups of the representative weeks is used
-            elif loadfactor_ror == 'high':
-                # Find the index of the max load factor
-                index_sol = ror_lf_reshape.sum(axis=1).iloc[np.where(group == w)].idxmax()
-                # Concat with the new line
-                ror_lf_new = pd.concat([ror_lf_new, pd.DataFrame([ror_lf_reshape.iloc[index_sol]])], ignore_index=True)
-            
-            # The minimum Load Factor of the week inside each groups of the representative weeks is used
-            elif loadfactor_ror == 'low':
-                # Find the index of the min load factor
-                index_sol = ror_lf_reshape.sum(axis=1).iloc[np.where(group == w)].idxmin()
-                # Concat with the new line
-                ror_lf_new = pd.concat([ror_lf_new, pd.DataFrame([ror_lf_reshape.iloc[index_sol]])], ignore_index=True)
-            
-            # The "most medium" Load Factor of the week inside each groups of the representative weeks is used
-            elif loadfactor_ror == 'medium':
-                # Average of the serie
-                avg = ror_lf_reshape.sum(axis=1).iloc[np.where(group == w)].mean()
-                # Calculate abs difference with the average
-                absd = (ror_lf_reshape.sum(axis=1).iloc[np.where(group == w)] - avg).abs()
-                # Find the index of the minimum difference
-                index_sol = absd.idxmin()
-                # Concat with the new line
-                ror_lf_new = pd.concat([ror_lf_new, pd.DataFrame([ror_lf_reshape.iloc[index_sol]])], ignore_index=True)
-                            
-            else:
-                print('Choice to make for loadfactor_ror in [random,high,medium,low]... EXIT...')
-
-        # Iterate over the DataFrame and populate the dictionary demand
-        dict_ror_lf_local = {(y,w,h): ror_lf_new.iloc[w-1,h-1]for w in weeks for h in hours}
-        dict_ror_lf={**dict_ror_lf,**dict_ror_lf_local}
+if profil_weeks == 'average' or  profil_weeks == "M4" or profil_weeks == 'kmedoids' :
+    # Week of each group used for the load factor (drawn for each year when random)
+    if loadfactor_ror == 'random':
+        dict_ror_lf = series_ywh(years, weeks, hours, select_profile(ror_lf_reshape, group, number_of_mean_weeks, loadfactor_ror, years, rng), copy=False)
+    else:
+        # Same weeks for every year: stored once, as a year-invariant profile
+        dict_ror_lf = series_profile(years, weeks, hours, select_profile(ror_lf_reshape, group, number_of_mean_weeks, loadfactor_ror, years[:1])[0])
 
 elif profil_weeks == 'maxmin':
     print('Not yet implemented ... EXIT(1)')
     exit()
 
-pt_hydro_ror.set_LF(copy.deepcopy(dict_ror_lf))
+pt_hydro_ror.set_LF(dict_ror_lf)
 
-# Energy
-pt_hydro_ror.set_isEvar({(y,w,h): False for y in years for w in weeks for h in hours})
-E = {(y,w,h): pt_hydro_ror.get_P()[y] * dict_ror_lf[y,w,h] for y in years for w in weeks for h in hours}
-pt_hydro_ror.set_E(copy.deepcopy(E))
+# Energy (exogenous) : E[y,w,h] = P[y] * LF[y,w,h], lazy when the LF is year-invariant
+pt_hydro_ror.set_isEvar(False)
+P_ror = np.array([pt_hydro_ror.get_P()[y] for y in years])
+E = dict_ror_lf.scaled(P_ror)
+pt_hydro_ror.set_E(E)
 
 #--------------------------
 # Economical parameters
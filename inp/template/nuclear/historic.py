@@ -9,7 +9,7 @@
 pt_nuclear_hist = prm_tech()
 
 # Power trajectory
-pt_nuclear_hist.set_isPvar({y: False for y in years}) # Capacity is exogeneous
+pt_nuclear_hist.set_isPvar(False) # Capacity is exogeneous
 
 # Capa installed
 df = pd.read_csv('../../../data/formatted/nuclear/capa_hist.dat', sep='\s+', names=['Year', '40y', '50y', '60y'])
@@ -25,7 +25,7 @@ if nuclear_hist_lifetime == 60:
     refu_annual_cost = 50e9*2 / 60e3 / 30 # REDO Better
 pt_nuclear_hist.set_P(data_P,data_P_years)
 
-pt_nuclear_hist.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours})  # Energy is endogeneous
+pt_nuclear_hist.set_isEvar(True)  # Energy is endogeneous
 
 #--------------------------
 # Economical parameters
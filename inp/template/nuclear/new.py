@@ -8,8 +8,8 @@
 
 pt_nuclear_new = prm_tech()
 
-pt_nuclear_new.set_isPvar({y: True for y in years}) # Capacity is endogeneous
-pt_nuclear_new.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours}) # Energy is endogeneous
+pt_nuclear_new.set_isPvar(True) # Capacity is endogeneous
+pt_nuclear_new.set_isEvar(True) # Energy is endogeneous
 
 pt_nuclear_new.set_A({(y,w): 0.80 for y in years for w in weeks}) # Availability factor
 
@@ -2,7 +2,9 @@
 # REN - Wind Off Shore
 ############################
 
-if len(sys.argv) > 1:
+if globals().get('profile_path'):   # Profile given by TechnoLoader
+    arg = profile_path
+elif len(sys.argv) > 1:
     arg = sys.argv[1]
 else:
     print("No argument provided for won.py... Please provide a path.")
@@ -13,70 +15,30 @@ else:
 #--------------------------
 
 pt_ren_wof = prm_tech()
-pt_ren_wof.set_isPvar({y: True for y in years})
-pt_ren_wof.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours})
+pt_ren_wof.set_isPvar(True)
+pt_ren_wof.set_isEvar(True)
 
 #--------------------------
-# Get 52 weeks of data
+# Get the periods of data (period_length hours x number_of_periods)
 #--------------------------
-wof_lf = np.loadtxt(arg).tolist()[:int(7*24*52)]
+wof_lf = load_profile(arg, period_length*number_of_periods)
 # Build dataframe with matrix form
-wof_lf_reshape = pd.DataFrame(np.array(wof_lf).reshape(-1, 7 * 24))
+wof_lf_reshape = pd.DataFrame(reshape_periods(wof_lf, period_length, number_of_periods))
 
 #--------------------------
 # Weeks managment
 #--------------------------
 
-if profil_weeks == 'average' or  profil_weeks == "M4" :
-    # Select a random index from the filtered indices
-    wof_lf_new = pd.DataFrame()
-    dict_wof_lf={}
-    for y in years :
-        wof_lf_new = pd.DataFrame()
-        for w in range(number_of_mean_weeks):
-
-            # A random week inside each groups of the representative weeks is used
-            if loadfactor_wof == 'random':
-                wof_lf_new = pd.concat([wof_lf_new, pd.DataFrame([wof_lf_reshape.iloc[random.choice(np.where(group == w)[0])]])], ignore_index=True)
-            
-            # The maximum Load Factor of the week inside each groups of the representative weeks is used
-            elif loadfactor_wof == 'high':
-                # Find the index of the max load factor
-                index_sol = wof_lf_reshape.sum(axis=1).iloc[np.where(group == w)].idxmax()
-                # Concat with the new line
-                wof_lf_new = pd.concat([wof_lf_new, pd.DataFrame([wof_lf_reshape.iloc[index_sol]])], ignore_index=True)
-            
-            # The minimum Load Factor of the week inside each groups of the representative weeks is used
-            elif loadfactor_wof == 'low':
-                # Find the index of the min load factor
-                index_sol = wof_lf_reshape.sum(axis=1).iloc[np.where(group == w)].idxmin()
-                # Concat with the new line
-                wof_lf_new = pd.concat([wof_lf_new, pd.DataFrame([wof_lf_reshape.iloc[index_sol]])], ignore_index=True)
-            
-            # The "most medium" Load Factor of the week inside each groups of the representative weeks is used
-            elif loadfactor_wof == 'medium':
-                # Average of the serie
-                avg = wof_lf_reshape.sum(axis=1).iloc[np.where(group == w)].mean()
-                # Calculate abs difference with the average
-                absd = (wof_lf_reshape.sum(axis=1).iloc[np.where(group == w)] - avg).abs()
-                # Find the index of the minimum difference
-                index_sol = absd.idxmin()
-                # Concat with the new line
-                wof_lf_new = pd.concat([wof_lf_new, pd.DataFrame([wof_lf_reshape.iloc[index_sol]])], ignore_index=True)
-                
-            else:
-                print('Choice to make for loadfactor_wof in [random,high,medium,low]... EXIT...')
-
-        # Iterate over the DataFrame and populate the dictionary demand
-        dict_wof_lf_local = {(y,w,h): wof_lf_new.iloc[w-1,h-1]for w in weeks for h in hours}
-        dict_wof_lf={**dict_wof_lf,**dict_wof_lf_local}
+if profil_weeks == 'average' or  profil_weeks == "M4" or profil_weeks == 'kmedoids' :
+    # Week of each group used for the load factor (drawn for each year when random)
+    dict_wof_lf = series_ywh(years, weeks, hours, select_profile(wof_lf_reshape, group, number_of_mean_weeks, loadfactor_wof, years, rng), copy=False)
 
 elif profil_weeks == 'maxmin':
     print('Not yet implemented ... EXIT(1)')
     exit()
 
 # Build the dict
-pt_ren_wof.set_LF(copy.deepcopy(dict_wof_lf))
+pt_ren_wof.set_LF(dict_wof_lf)
 
 #--------------------------
 # Economical parameters
@@ -8,8 +8,8 @@
 
 pt_stock_bat_c = prm_tech()
 
-pt_stock_bat_c.set_isPvar({y: True for y in years})
-pt_stock_bat_c.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours})  # Energy is endogeneous
+pt_stock_bat_c.set_isPvar(True)
+pt_stock_bat_c.set_isEvar(True)  # Energy is endogeneous
 
 #--------------------------
 # Economical parameters - STEP Charge
@@ -87,8 +87,8 @@ pt_stock_bat_c.set_InvMax({y: bat_invest_max for y in range(years.start-1, years
 
 pt_stock_bat_d = prm_tech()
 
-pt_stock_bat_d.set_isPvar({y: True for y in years})
-pt_stock_bat_d.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours})  # Energy is endogeneous
+pt_stock_bat_d.set_isPvar(True)
+pt_stock_bat_d.set_isEvar(True)  # Energy is endogeneous
 
 #--------------------------
 # Economical parameters - STEP discharge
@@ -8,11 +8,11 @@
 
 pt_hydro_step_c = prm_tech()
 
-pt_hydro_step_c.set_isPvar({y: False for y in years})
+pt_hydro_step_c.set_isPvar(False)
 
 pt_hydro_step_c.set_P(5394)
 
-pt_hydro_step_c.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours})  # Energy is endogeneous
+pt_hydro_step_c.set_isEvar(True)  # Energy is endogeneous
 
 #--------------------------
 # Economical parameters - STEP Charge
@@ -56,8 +56,8 @@ pe_hydro_step_c.set_var_mi(data_var_mi)
 
 pt_hydro_step_d = prm_tech()
 
-pt_hydro_step_d.set_isPvar({y: False for y in years})
-pt_hydro_step_d.set_isEvar({(y,w,h): True for y in years for w in weeks for h in hours})  # Energy is endogeneous
+pt_hydro_step_d.set_isPvar(False)
+pt_hydro_step_d.set_isEvar(True)  # Energy is endogeneous
 
 pt_hydro_step_d.set_P(5394)
 
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from typing import Any
 
 
@@ -42,12 +43,12 @@ class Techno:
         """Validate that storage charging segment has non-positive variable costs if defined.
 
         For a charging techno (title == 'charge'), any defined variable cost profile (OM, fuel, CO2, MI)
-        should have at least one non-positive value. Empty dicts are ignored.
+        should have at least one non-positive value. Empty series are ignored.
         """
         if self._type == 'storage' and self._title == 'charge':
             eco = self._prm_eco
-            def _has_only_positive(d: dict) -> bool:
-                return isinstance(d, dict) and d and all(v > 0 for v in d.values())
+            def _has_only_positive(d: Mapping) -> bool:
+                return isinstance(d, Mapping) and len(d) > 0 and all(v > 0 for v in d.values())
             checks = [
                 (eco.get_var_om(), "OM"),
                 (eco.get_var_f(), "Fuel"),
@@ -34,25 +34,53 @@ class prm_eco:
         #| dt = temps de vie
         if occ is None :
             self._is_cap = False
-            self._fix_cap={0 for y in years_world}
+            self._fix_cap = series_year.constant(years_world)
             print(" WARNING, CAPEX is 0")
+            return
+        self._is_cap = True
         # occ_l Liste - regression lineaire entre éléments connu
-        elif isinstance(occ, list) :
-            self._is_cap = True
-            occ_l= np.interp(years_world,yd_l,occ)
-            capex={}
-            for i, y in enumerate(years_world):
-                tic = occ_l[i] / ct * ( (1 + r[y]) / r[y] ) * ( (1 + r[y])**ct - 1)
-                capex[y] = tic * ( ( r[y] * ( 1 + r[y] )**dt ) / ( (1 + r[y])**dt - 1) )
-            self._fix_cap = capex
+        if isinstance(occ, list) :
+            occ_l = np.interp(list(years_world),yd_l,occ)
         # occ is a float
         else :
-            self._is_cap = True
-            capex={}
-            for i, y in enumerate(years_world):
-                tic = occ / ct * ( (1 + r[y]) / r[y] ) * ( (1 + r[y])**ct - 1)
-                capex[y] = tic * ( ( r[y] * ( 1 + r[y] )**dt ) / ( (1 + r[y])**dt - 1) )
-            self._fix_cap = capex
+            occ_l = occ
+        r_l = r.to_numpy() if isinstance(r, series_year) else np.array([r[y] for y in years_world])
+        idc, annuity = prm_eco.capex_factors(r_l, ct, dt)
+        tic = occ_l * idc
+        capex = tic * annuity
+        self._fix_cap = series_year(years_world, capex)
+
+    # Facteurs IDC et annuité mémorisés par (r, ct, dt) : partagés par toutes les technos (charge/décharge des stockages,
+    # mêmes taux) et tous les scénarios d'un balayage, seuls les taux encore jamais vus sont calculés
+    _capex_factors = {}
+
+    @classmethod
+    def capex_factors(cls, r_l, ct, dt):
+        """IDC and annuity factors for each discount rate of r_l (TIC = OCC * idc, CAPEX = TIC * annuity)."""
+        r_u, inv = np.unique(np.asarray(r_l, dtype=float), return_inverse=True)
+        new = np.array([(rv, ct, dt) not in cls._capex_factors for rv in r_u.tolist()], dtype=bool)
+        if new.any():
+            r_n = r_u[new]
+            idc = 1 / ct * ( (1 + r_n) / r_n ) * ( (1 + r_n)**ct - 1)
+            annuity = ( r_n * ( 1 + r_n )**dt ) / ( (1 + r_n)**dt - 1)
+            cls._capex_factors.update({(rv, ct, dt): (i, a) for rv, i, a in zip(r_n.tolist(), idc.tolist(), annuity.tolist())})
+        factors = np.array([cls._capex_factors[(rv, ct, dt)] for rv in r_u.tolist()]).reshape(-1, 2)
+        return factors[inv.ravel(), 0], factors[inv.ravel(), 1]
+
+    # Every cost parameter is a series over years_world built from :
+    # None (0 everywhere) | a scalar | a list of 1 element | a list of values with their years (interpolated)
+    # Constant series (None, scalar, 1 element) are the shared read-only instances of series_year.constant
+    def _year_series(self, val, yd_l, name):
+        if val is None:
+            return series_year.constant(years_world)
+        if isinstance(val, list):
+            if len(val) == 1:
+                return series_year.constant(years_world, val[0])
+            elif len(val) > 1:
+                return series_year.from_points(val, yd_l, years_world)
+            print(f"error : {name}=[] is not good")
+            return None
+        return series_year.constant(years_world, val)
 
 # --------------------- GET/SET methods -------------------------------------------------------------------------------
 
@@ -91,35 +119,22 @@ class prm_eco:
         return self._lt
     
     def get_var_tot(self):
-        var = {y: self._var_om[y]+ self._var_f[y] + self._var_co2[y] + self._var_mi[y] for y in years_world}
-        return var
+        return self._var_om + self._var_f + self._var_co2 + self._var_mi
     
     def get_cost_profile_tot(self,y):
         U = np.arange(1, 8761, 1)
-        if self._is_cap:
-            return self._fix_cap[y] + self._fix_om[y]+ self._fix_mi[y] + (self._var_om[y]+ self._var_f[y] + self._var_co2[y] + self._var_mi[y]) * U
-        else:
-            return self._fix_dep[y] + self._fix_om[y]+ self._fix_mi[y] + (self._var_om[y]+ self._var_f[y] + self._var_co2[y] + self._var_mi[y]) * U
+        return self.get_cost_profile_fix()[y] + self.get_var_tot()[y] * U
 
     def get_cost_profile_fix(self) :
         if self._is_cap:
-            fix = {y: self.get_fix_cap()[y] + self.get_fix_mi()[y] + self.get_fix_om()[y] for y in years_world}
+            return self._fix_cap + self._fix_mi + self._fix_om
         else:
-            fix = {y: self.get_fix_dep()[y] + self.get_fix_mi()[y] + self.get_fix_om()[y] for y in years_world}
-        return fix
+            return self._fix_dep + self._fix_mi + self._fix_om
     
 
     # Set methods
     def set_r(self, r, yd_l=None):
-        if r is None:
-            self._r ={ y :0 for y in years_world}
-        elif isinstance(r, list):
-            if len(r) == 1:
-                self._r ={ y : r[0] for y in years_world}
-            else:
-                self._r = create_val_dictionary(r, yd_l)
-        else:
-            self._r ={ y : r for y in years_world}
+        self._r = self._year_series(r, yd_l, 'r')
 
     def set_lt(self, lt):
         self._lt = lt
@@ -141,111 +156,29 @@ class prm_eco:
 #            self._fix_cap ={ y : fix_cap for y in years}
 
     def set_fix_dep(self, fix_dep, yd_l=None):
-        if fix_dep is None:
-            self._is_dep = False
-            self._fix_dep = { y :0 for y in years_world}
-        elif isinstance(fix_dep, list):
-            self._is_dep = True
-            if len(fix_dep) == 1:
-                self._fix_dep ={ y : fix_dep[0] for y in years_world}
-            elif len(fix_dep) > 1:
-                self._fix_dep = create_val_dictionary(fix_dep, yd_l)
-            else:
-                print("error : fix_dep=[] is not good")
-        else:
-            self._is_dep = True
-            self._fix_dep ={ y : fix_dep for y in years_world}
+        self._is_dep = fix_dep is not None
+        self._fix_dep = self._year_series(fix_dep, yd_l, 'fix_dep')
             
     def set_fix_ref(self, fix_ref, yd_l=None):
-        if fix_ref is None:
-            self._fix_ref = { y :0 for y in years_world}
-        elif isinstance(fix_ref, list):
-            if len(fix_ref) == 1:
-                self._fix_ref ={ y : fix_ref[0] for y in years_world}
-            elif len(fix_ref) > 1:
-                self._fix_ref = create_val_dictionary(fix_ref, yd_l)
-            else:
-                print("error : fix_ref=[] is not good")
-        else:
-            self._fix_ref ={ y : fix_ref for y in years_world}
+        self._fix_ref = self._year_series(fix_ref, yd_l, 'fix_ref')
 
     def set_fix_om(self, fix_om,yd_l=None):
-        if fix_om is None:
-            self._fix_om ={ y :0 for y in years_world}
-        elif isinstance(fix_om, list):
-            if len(fix_om) == 1:
-                self._fix_om ={ y : fix_om[0] for y in years_world}
-            elif len(fix_om) > 1:
-                self._fix_om = create_val_dictionary(fix_om, yd_l)
-            else:
-                print("error : fix_om=[] is not good")
-        else:
-            self._fix_om ={ y :fix_om for y in years_world}
+        self._fix_om = self._year_series(fix_om, yd_l, 'fix_om')
             
     def set_fix_mi(self, fix_mi,yd_l=None):
-        if fix_mi is None:
-            self._fix_mi ={ y :0 for y in years_world}
-        elif isinstance(fix_mi, list):
-            if len(fix_mi) == 1:
-                self._fix_mi ={ y :fix_mi[0] for y in years_world}
-            elif len(fix_mi) > 1:
-                self._fix_mi = create_val_dictionary(fix_mi, yd_l)
-            else:
-                print("error : fix_mi=[] is not good")
-        else:
-            self._fix_mi ={ y :fix_mi for y in years_world}
+        self._fix_mi = self._year_series(fix_mi, yd_l, 'fix_mi')
             
     def set_var_om(self, var_om,yd_l=None):
-        if var_om is None:
-            self._var_om ={ y :0 for y in years_world}
-        elif isinstance(var_om, list):
-            if len(var_om) == 1:
-                self._var_om ={ y :var_om[0] for y in years_world}
-            elif len(var_om) > 1:
-                self._var_om = create_val_dictionary(var_om, yd_l)
-            else:
-                print("error : var_om=[] is not good")
-        else:
-            self._var_om ={ y :var_om for y in years_world}
+        self._var_om = self._year_series(var_om, yd_l, 'var_om')
             
     def set_var_f(self, var_f,yd_l=None):
-        if var_f is None:
-            self._var_f ={ y :0 for y in years_world}
-        elif isinstance(var_f, list):
-            if len(var_f) == 1:
-                self._var_f ={ y :var_f[0] for y in years_world}
-            elif len(var_f) > 1:
-                self._var_f = create_val_dictionary(var_f, yd_l)
-            else:
-                print("error : var_f=[] is not good")
-        else:
-            self._var_f ={ y :var_f for y in years_world}
+        self._var_f = self._year_series(var_f, yd_l, 'var_f')
             
     def set_var_co2(self, var_co2,yd_l=None):
-        if var_co2 is None:
-            self._var_co2 ={ y :0 for y in years_world}
-        elif isinstance(var_co2, list):
-            if len(var_co2) == 1:
-                self._var_co2 ={ y :var_co2[0] for y in years_world}
-            elif len(var_co2) > 1:
-                self._var_co2 = create_val_dictionary(var_co2, yd_l)
-            else:
-                print("error : var_co2=[] is not good")
-        else:
-            self._var_co2 ={ y :var_co2 for y in years_world}
+        self._var_co2 = self._year_series(var_co2, yd_l, 'var_co2')
             
     def set_var_mi(self, var_mi,yd_l=None):
-        if var_mi is None:
-            self._var_mi ={ y :0 for y in years_world}
-        elif isinstance(var_mi, list):
-            if len(var_mi) == 1:
-                self._var_mi ={ y :var_mi[0] for y in years_world}
-            elif len(var_mi) > 1:
-                self._var_mi = create_val_dictionary(var_mi, yd_l)
-            else:
-                print("error : var_mi=[] is not good")
-        else:
-            self._var_mi ={ y :var_mi for y in years_world}      
+        self._var_mi = self._year_series(var_mi, yd_l, 'var_mi')
 
     def set_deco_cost(self, dc):
         self._deco_cost = dc
@@ -2,19 +2,19 @@ class prm_tech:
 # --------------------- Constructor -----------------------------------------------------------------------------------
     def __init__(self):
 
-        self._isPvar  = {y: True for y in years}  # Tell if Power is endogeneous (variable) or exogeneous
-        self._isEvar  = {(y,w,h): True for y in years for w in weeks for h in hours}  # Tell if Energy is endogeneous (variable) or exogeneous
+        self._isPvar  = series_mask((years,), True)                # Tell if Power is endogeneous (variable) or exogeneous
+        self._isEvar  = series_mask((years, weeks, hours), True)  # Tell if Energy is endogeneous (variable) or exogeneous
    
         self._P   = None   # Capacity installed P[y] [MW]  
         self._Inv = None   # Investment in capacity Inv[y] [MW]  
         self._InvMax = None   # Maximum capacity deployment per year [y] [MW/y]  
         self._Dec = None   # Decommissioning in capacity Dec[y] [MW]  
-        self._E   = None   # Energy produced E[y,h]
-        self._LF  = None   # Load Factor LF[y,h]
+        self._E   = None   # Energy produced E[y,w,h] (series_ywh)
+        self._LF  = None   # Load Factor LF[y,w,h] (series_ywh)
         
         self._C02 = None   # CO2 emission factor [g/kWh]
 
-        self._C   = None   # Curtailment C[y,h]
+        self._C   = None   # Curtailment C[y,w,h] (series_ywh)
         self._A   = None   # Availabilité of dispatchable techno A[y,w] between 0 and 1
                             # 0 means all units are off
                             # 1 means all units are full operationnal
@@ -24,6 +24,24 @@ class prm_tech:
 
 # --------------------- End Of Constructor ----------------------------------------------------------------------------
 
+    # Hourly quantities are stored as dense (y,w,h) arrays, arrays [y,w,h] and dicts keyed by (y,w,h) are
+    # converted and a series passed in is shared copy-on-write rather than copied
+    def _as_series_ywh(self, val):
+        if val is None:
+            return val
+        if isinstance(val, series_ywh):
+            return val.share()
+        if isinstance(val, np.ndarray):
+            return series_ywh(years, weeks, hours, val)
+        return series_ywh.from_dict(val, years, weeks, hours)
+
+    # Endogeneity flags are stored as masks, a bool sets the whole techno at once
+    def _as_mask(self, val, axes):
+        if isinstance(val, series_mask):
+            return val
+        if hasattr(val, 'keys'):
+            return series_mask.from_dict(val, axes)
+        return series_mask(axes, val)
 
 # --------------------- GET/SET methods -------------------------------------------------------------------------------
 
@@ -72,9 +90,9 @@ class prm_tech:
     
     # Set methods
     def set_isPvar(self, isPvar):
-        self._isPvar = isPvar
+        self._isPvar = self._as_mask(isPvar, (years,))
     def set_isEvar(self, isEvar):
-        self._isEvar = isEvar
+        self._isEvar = self._as_mask(isEvar, (years, weeks, hours))
 
     def set_P(self, P, yd_l=None):
         if P is None:
@@ -83,7 +101,7 @@ class prm_tech:
             if len(P) == 1:
                 self._P ={ y : P[0] for y in years_world}
             elif len(P) > 1:
-                self._P = create_val_dictionary(P, yd_l)
+                self._P = create_val_dictionary(P, yd_l, years_world)
             else:
                 print("error : P=[] is not good")
         elif isinstance(P, dict):
@@ -98,9 +116,9 @@ class prm_tech:
     def set_Dec(self, Dec):
         self._Dec = Dec
     def set_E(self, E):
-        self._E = E
+        self._E = self._as_series_ywh(E)
     def set_LF(self, LF):
-        self._LF = LF
+        self._LF = self._as_series_ywh(LF)
     def set_LFmax(self, LFmax):
         self._LFmax = LFmax
     def set_LFmin(self, LFmin):
@@ -108,7 +126,7 @@ class prm_tech:
     def set_CO2(self, CO2):
         self._CO2 = CO2
     def set_C(self, C):
-        self._C = C
+        self._C = self._as_series_ywh(C)
     def set_A(self, avail):
         self._A = avail
         
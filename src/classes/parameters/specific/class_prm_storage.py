@@ -4,7 +4,7 @@ class prm_storage:
 
         self._mode  = None      # mode[y,h] is either 'turbine' or 'compress'
         self._EC    = None      # Energy compressed EC[y,h]
-        self._level = None      # level of the storage get_level()[y,h] [MWh]
+        self._level = None      # level of the storage get_level()[y,w,h] [MWh] (series_ywh)
         self._levelstart = None # level of the storage get_level()[y,h] [MWh]
         self._levelmax_time = None   # level max [h full power]
         self._levelmax = None   # level max [MWh]
@@ -23,6 +23,16 @@ class prm_storage:
 
 # --------------------- End Of Constructor ----------------------------------------------------------------------------
 
+    # Storage level stored as a dense (y,w,h) series, as the hourly quantities of prm_tech
+    def _as_series_ywh(self, val):
+        if val is None:
+            return val
+        if isinstance(val, series_ywh):
+            return val.share()
+        if isinstance(val, np.ndarray):
+            return series_ywh(years, weeks, hours, val)
+        return series_ywh.from_dict(val, years, weeks, hours)
+
 # --------------------- GET/SET methods -------------------------------------------------------------------------------
 
     # Get methods
@@ -59,7 +69,7 @@ class prm_storage:
     def set_EC(self, EC):
         self._EC = EC
     def set_level(self, lev):
-        self._level = lev
+        self._level = self._as_series_ywh(lev)
     def set_level_max_time(self, levmax_time):
         self._levelmax_time = levmax_time
     def set_level_max(self, levmax):
@@ -0,0 +1,116 @@
+from collections.abc import Mapping
+from itertools import product
+
+import numpy as np
+
+
+class series_mask(Mapping):
+    """Boolean mask over a grid of axes (e.g. (years,) or (years, weeks, hours)).
+
+    A uniform mask only stores its scalar value. A varying mask is kept as a packed bit array
+    (one bit per cell). Lookups use the same keys as the legacy dicts: ``mask[y]`` for a single
+    axis and ``mask[y, w, h]`` for several axes.
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, axes, value=True):
+
+        self._axes  = tuple(axes)                     # Grid axes (ranges)
+        self._shape = tuple(len(a) for a in self._axes)
+        self._size  = int(np.prod(self._shape))
+        self._value = None                            # Scalar value when the mask is uniform
+        self._bits  = None                            # Packed bits when the mask varies
+        self.set(value)
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, d, axes):
+        """Build a mask from a dict keyed like the grid (scalar keys for a single axis)."""
+        if isinstance(d, series_mask):
+            return d
+        axes = tuple(axes)
+        keys = axes[0] if len(axes) == 1 else product(*axes)
+        size = int(np.prod([len(a) for a in axes]))
+        data = np.fromiter((d[k] for k in keys), dtype=bool, count=size)
+        return cls(axes, data)
+
+    def set(self, value):
+        """Set the mask from a scalar or from an array shaped like the grid."""
+        if np.ndim(value) == 0:
+            self._value, self._bits = bool(value), None
+            return
+        data = np.asarray(value, dtype=bool).reshape(self._shape)
+        if data.all() or not data.any():
+            self._value, self._bits = bool(data.flat[0]), None
+        else:
+            self._value, self._bits = None, np.packbits(data.ravel())
+
+# --------------------- Index helpers ---------------------------------------------------------------------------------
+
+    def _flat(self, key):
+        if len(self._axes) == 1:
+            key = (key,)
+        if len(key) != len(self._axes):
+            raise KeyError(key)
+        i = 0
+        try:
+            for a, n, k in zip(self._axes, self._shape, key):
+                i = i * n + a.index(k)
+        except ValueError:
+            raise KeyError(key) from None
+        return i
+
+# --------------------- Mapping interface -----------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        i = self._flat(key)
+        if self._bits is None:
+            return self._value
+        return bool((self._bits[i >> 3] >> (7 - (i & 7))) & 1)
+
+    def __contains__(self, key):
+        try:
+            self._flat(key)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._axes[0]) if len(self._axes) == 1 else product(*self._axes)
+
+    def __len__(self):
+        return self._size
+
+    def values(self):
+        return self.to_numpy().ravel()
+
+    def items(self):
+        return zip(iter(self), self.to_numpy().ravel().tolist())
+
+    def __repr__(self):
+        value = self._value if self._bits is None else 'varying'
+        return f"series_mask(shape={self._shape}, value={value})"
+
+# --------------------- Vectorized access -----------------------------------------------------------------------------
+
+    def is_uniform(self):
+        return self._bits is None
+
+    def get_value(self):
+        """Scalar value of a uniform mask, None if the mask varies."""
+        return self._value
+
+    def any(self):
+        return self._value if self._bits is None else True
+
+    def all(self):
+        return self._value if self._bits is None else False
+
+    def to_numpy(self):
+        """Boolean array shaped like the grid."""
+        if self._bits is None:
+            return np.full(self._shape, self._value, dtype=bool)
+        return np.unpackbits(self._bits, count=self._size).astype(bool).reshape(self._shape)
+
+    def get_axes(self):
+        return self._axes
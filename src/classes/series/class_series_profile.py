@@ -0,0 +1,126 @@
+import numpy as np
+
+
+class series_profile(series_ywh):
+    """Year-invariant hourly series ``scale[y] * base[w, h]``.
+
+    Only the base profile [n_weeks, n_hours] and an optional per-year scale [n_years] are stored
+    (no scale means 1 for every year). Lookups and ``year``/``week`` are computed from them; the
+    dense [n_years, n_weeks, n_hours] array is only built when ``to_numpy``/``values`` is called,
+    or when the series is written to, after which it behaves like a plain series_ywh.
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, years, weeks, hours, base, scale=None):
+
+        self._years = years   # Year axis (range of scenario years)
+        self._weeks = weeks   # Representative week axis
+        self._hours = hours   # Hour axis inside a week
+
+        self._base  = self._frozen(np.asarray(base, dtype=float).reshape(len(weeks), len(hours)))
+        self._scale = None if scale is None else self._frozen(
+            np.broadcast_to(np.asarray(scale, dtype=float), (len(years),)))
+        self._dense = None    # Dense array, built on demand
+        self._lazy  = True    # Values given by base and scale, until the first write
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    @staticmethod
+    def _frozen(a):
+        a = a.view()
+        a.flags.writeable = False
+        return a
+
+    @property
+    def _data(self):
+        if self._dense is None:
+            shape = (len(self._years),) + self._base.shape
+            if self._scale is None:
+                self._dense = np.broadcast_to(self._base, shape)
+            else:
+                self._dense = self._frozen(self._scale[:, None, None] * self._base)
+        return self._dense
+
+    @_data.setter
+    def _data(self, value):
+        self._dense = value
+
+    def _writable(self):
+        # Première écriture : la série devient dense, base et scale ne sont plus utilisés
+        self._lazy = False
+        return super()._writable()
+
+    def is_lazy(self):
+        """True while values are still given by base and scale (no write happened)."""
+        return self._lazy
+
+    def _factor(self, iy):
+        return 1.0 if self._scale is None else self._scale[iy]
+
+# --------------------- Mapping interface -----------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        if not self.is_lazy():
+            return self._dense[self._loc(key)]
+        iy, iw, ih = self._loc(key)
+        return self._factor(iy) * self._base[iw, ih]
+
+    def __len__(self):
+        return len(self._years) * self._base.size
+
+    def __repr__(self):
+        return f"series_profile(years={self._years}, weeks={self._weeks}, hours={self._hours})"
+
+# --------------------- Vectorized access -----------------------------------------------------------------------------
+
+    def year(self, y):
+        if not self.is_lazy():
+            return self._dense[self._year_loc(y)]
+        iy = self._year_loc(y)
+        return self._base if self._scale is None else self._factor(iy) * self._base
+
+    def week(self, y, w):
+        if not self.is_lazy():
+            return super().week(y, w)
+        try:
+            iw = self._weeks.index(w)
+        except ValueError:
+            raise KeyError((y, w)) from None
+        return self._factor(self._year_loc(y)) * self._base[iw]
+
+    def scaled(self, scale):
+        """Series scale[y] * self[y, w, h], still year-invariant in shape."""
+        if not self.is_lazy():
+            return super().scaled(scale)
+        scale = np.broadcast_to(np.asarray(scale, dtype=float), (len(self._years),))
+        return series_profile(self._years, self._weeks, self._hours, self._base,
+                              scale if self._scale is None else self._scale * scale)
+
+    def share(self):
+        if not self.is_lazy():
+            return super().share()
+        return series_profile(self._years, self._weeks, self._hours, self._base, self._scale)
+
+# --------------------- GET methods -----------------------------------------------------------------------------------
+
+    def get_base(self):
+        """Base profile [n_weeks, n_hours] (read-only)."""
+        return self._base
+    def get_scale(self):
+        """Per-year scale [n_years] (read-only), None when every year uses the base profile as is."""
+        return self._scale
+
+    @property
+    def shape(self):
+        return (len(self._years),) + self._base.shape
+
+    def __getstate__(self):
+        # Une série non modifiée est enregistrée sans son tableau dense (reconstruit à la demande)
+        state = self.__dict__.copy()
+        if self._lazy:
+            state['_dense'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._dense is not None:
+            self._dense.flags.writeable = False
@@ -0,0 +1,127 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class series_year(Mapping):
+    """Yearly series backed by a NumPy array aligned on a year axis (usually years_world).
+
+    ``s[y]`` behaves like the legacy ``{year: value}`` dicts. Arithmetic between series on the
+    same axis (or with scalars) is a single array operation and returns a new series.
+
+    Constant series are shared: ``series_year.constant(years, value)`` returns one read-only
+    instance per (year axis, value).
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, years, data=None, fill=0.0):
+
+        self._years = years   # Year axis
+        if data is None:
+            self._data = np.full(len(years), fill, dtype=float)
+        else:
+            self._data = np.array(data, dtype=float).reshape(len(years))
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    @classmethod
+    def from_points(cls, known_vals, known_years, years):
+        """Linear interpolation of known (year, value) points over the year axis."""
+        if len(known_vals) != len(known_years):
+            raise ValueError("known_vals and known_years must have same length")
+        return cls(years, np.interp(list(years), known_years, known_vals))
+
+    # Séries constantes partagées (flyweight) : une instance en lecture seule par (axe, valeur)
+    _constants = {}
+
+    @classmethod
+    def constant(cls, years, value=0.0):
+        """Shared read-only series equal to value for every year."""
+        key = (years, float(value))
+        s = cls._constants.get(key)
+        if s is None:
+            s = cls(years, fill=value)
+            s._data.flags.writeable = False
+            s._constant = float(value)
+            cls._constants[key] = s
+        return s
+
+    def __reduce_ex__(self, protocol):
+        # Une série constante est rechargée comme l'instance partagée
+        if getattr(self, '_constant', None) is not None:
+            return (series_year.constant, (self._years, self._constant))
+        return super().__reduce_ex__(protocol)
+
+# --------------------- Index helpers ---------------------------------------------------------------------------------
+
+    def _loc(self, y):
+        try:
+            return self._years.index(y)
+        except ValueError:
+            raise KeyError(y) from None
+
+    def _operand(self, other):
+        if isinstance(other, series_year):
+            if other._years != self._years:
+                raise ValueError("series_year operands must share the same year axis")
+            return other._data
+        return other
+
+# --------------------- Mapping interface -----------------------------------------------------------------------------
+
+    def __getitem__(self, y):
+        return self._data[self._loc(y)]
+
+    def __contains__(self, y):
+        try:
+            self._loc(y)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._years)
+
+    def __len__(self):
+        return len(self._years)
+
+    def values(self):
+        return self._data
+
+    def items(self):
+        return zip(self._years, self._data.tolist())
+
+    def __repr__(self):
+        return f"series_year(years={self._years})"
+
+# --------------------- Arithmetic ------------------------------------------------------------------------------------
+
+    def __add__(self, other):
+        return series_year(self._years, self._data + self._operand(other))
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return series_year(self._years, self._data - self._operand(other))
+
+    def __mul__(self, other):
+        return series_year(self._years, self._data * self._operand(other))
+    __rmul__ = __mul__
+
+# --------------------- Vectorized access -----------------------------------------------------------------------------
+
+    def to_numpy(self):
+        return self._data
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def select(self, years):
+        """Values for a sub-range of years, as an array."""
+        if isinstance(years, range) and len(years) and years.step == 1:
+            i0 = self._loc(years[0])
+            if self._loc(years[-1]) == i0 + len(years) - 1:
+                return self._data[i0:i0 + len(years)]
+        return self._data[[self._loc(y) for y in years]]
+
+    def get_years(self):
+        return self._years
+
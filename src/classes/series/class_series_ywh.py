@@ -0,0 +1,155 @@
+from collections.abc import Mapping
+from itertools import product
+
+import numpy as np
+
+
+class series_ywh(Mapping):
+    """Dense hourly series indexed by (year, week, hour).
+
+    Values live in a single float array of shape [n_years, n_weeks, n_hours]. Indexing with a
+    ``(y, w, h)`` tuple behaves like the legacy dict keyed by tuples, so code reading
+    ``LF[y, w, h]`` keeps working, while vectorized code uses ``year``, ``week`` or ``to_numpy``.
+
+    Buffers are shared copy-on-write: ``share``/``copy``/``deepcopy`` return a series on the same
+    array, which is then marked read-only, and the first series written to copies it.
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, years, weeks, hours, data=None, fill=0.0, copy=True):
+
+        self._years = years   # Year axis (range of scenario years)
+        self._weeks = weeks   # Representative week axis
+        self._hours = hours   # Hour axis inside a week
+
+        shape = (len(years), len(weeks), len(hours))
+        if data is None:
+            self._data = np.full(shape, fill, dtype=float)
+        elif copy:
+            self._data = np.array(data, dtype=float).reshape(shape)
+        else:
+            # Shared buffer (e.g. a broadcast week repeated over the years): read-only, copied on first write
+            self._data = np.asarray(data, dtype=float).reshape(shape)
+            if self._data.flags.writeable:
+                self._data = self._data.view()
+                self._data.flags.writeable = False
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, d, years, weeks, hours):
+        """Build a series from a dict keyed by (y, w, h) covering the full grid."""
+        if isinstance(d, series_ywh):
+            return d
+        n = len(years) * len(weeks) * len(hours)
+        data = np.fromiter((d[k] for k in product(years, weeks, hours)), dtype=float, count=n)
+        return cls(years, weeks, hours, data)
+
+# --------------------- Index helpers ---------------------------------------------------------------------------------
+
+    def _loc(self, key):
+        y, w, h = key
+        try:
+            return self._years.index(y), self._weeks.index(w), self._hours.index(h)
+        except ValueError:
+            raise KeyError(key) from None
+
+    def _writable(self):
+        # Copy-on-write : un buffer partagé (lecture seule) est copié avant la première écriture
+        if not self._data.flags.writeable:
+            self._data = self._data.copy()
+        return self._data
+
+    def _year_loc(self, y):
+        try:
+            return self._years.index(y)
+        except ValueError:
+            raise KeyError(y) from None
+
+# --------------------- Mapping interface -----------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        return self._data[self._loc(key)]
+
+    def __setitem__(self, key, value):
+        self._writable()[self._loc(key)] = value
+
+    def __contains__(self, key):
+        try:
+            self._loc(key)
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(product(self._years, self._weeks, self._hours))
+
+    def __len__(self):
+        return self._data.size
+
+    def values(self):
+        """Flat view of the values in (y, w, h) order."""
+        return self._data.ravel()
+
+    def items(self):
+        return zip(product(self._years, self._weeks, self._hours), self._data.ravel().tolist())
+
+    def __repr__(self):
+        return f"series_ywh(years={self._years}, weeks={self._weeks}, hours={self._hours})"
+
+# --------------------- Vectorized access -----------------------------------------------------------------------------
+
+    def year(self, y):
+        """Array view [n_weeks, n_hours] of year y."""
+        return self._data[self._year_loc(y)]
+
+    def week(self, y, w):
+        """Array view [n_hours] of week w of year y."""
+        try:
+            return self._data[self._year_loc(y), self._weeks.index(w)]
+        except ValueError:
+            raise KeyError((y, w)) from None
+
+    def set_year(self, y, values):
+        self._writable()[self._year_loc(y)] = values
+
+    def to_numpy(self):
+        """Underlying array [n_years, n_weeks, n_hours] (read-only when the buffer is shared)."""
+        return self._data
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def scaled(self, scale):
+        """Series scale[y] * self[y, w, h] (e.g. exogenous energy P * LF), scale being a scalar or [n_years]."""
+        scale = np.broadcast_to(np.asarray(scale, dtype=float), (len(self._years),))
+        return series_ywh(self._years, self._weeks, self._hours, scale[:, None, None] * self._data, copy=False)
+
+    def share(self):
+        """Series on the same buffer; the buffer becomes read-only and is copied by the first writer."""
+        self._data.flags.writeable = False
+        return series_ywh(self._years, self._weeks, self._hours, self._data, copy=False)
+
+    def copy(self):
+        return self.share()
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.share()
+
+    def __setstate__(self, state):
+        # Des séries partageant un buffer le partagent encore après pickle : on le repasse en lecture seule
+        self.__dict__.update(state)
+        self._data.flags.writeable = False
+
+# --------------------- GET methods -----------------------------------------------------------------------------------
+
+    def get_years(self):
+        return self._years
+    def get_weeks(self):
+        return self._weeks
+    def get_hours(self):
+        return self._hours
+
+    @property
+    def shape(self):
+        return self._data.shape
@@ -1,58 +1,140 @@
+import hashlib
+import heapq
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from scipy.cluster.hierarchy import dendrogram, fcluster
+
+try:
+    # Import relatif dans le paquet func, sinon depuis le dossier du script (%run, techno_loader)
+    from .distance_cluster import adjacent_distances, camille_distance_block, variance_distance_stats, ward_distance_stats
+    from .select_weeks import select_weeks
+except ImportError:
+    from distance_cluster import adjacent_distances, camille_distance_block, variance_distance_stats, ward_distance_stats
+    from select_weeks import select_weeks
+
 # Oopen class room clustering
 # voir https://openclassrooms.com/fr/courses/4379436-explorez-vos-donnees-avec-des-algorithme[…]z-vos-donnees-avec-un-algorithme-de-clustering-hierarchique
 '''
-La particularité de cette algorithme de clustering est qu'il doit garder l'ordre temporel des semaines. Normalement, un algo de clustering fusionne deux point qui sont les plus proche. Ici, seul les semaines adjacentes, les clusters adjacents peuvent fusionner. Ainsi, à chaque fois qu'il y a fusion, nous prenons bien soin de replacer le nouveau cluster dans son emplacement'''
+La particularité de cette algorithme de clustering est qu'il doit garder l'ordre temporel des semaines. Normalement, un algo de clustering fusionne deux point qui sont les plus proche. Ici, seul les semaines adjacentes, les clusters adjacents peuvent fusionner. Ainsi, à chaque fois qu'il y a fusion, nous prenons bien soin de replacer le nouveau cluster dans son emplacement
+
+Implémentation incrémentale : un cluster est un bloc contigu de semaines [debut, fin[ repéré par sa première semaine.
+On garde pour chaque cluster sa taille et son centroïde, et les distances entre clusters adjacents sont rangées dans un tas.
+Après une fusion, seules les distances avec les deux voisins du nouveau cluster sont recalculées (les entrées périmées du tas
+sont ignorées à leur sortie). En cas d'égalité, la paire la plus à gauche fusionne en premier, comme np.argmin.
+Les distances sont calculées à partir des statistiques suffisantes des clusters (taille, somme, somme des carrés) :
+ward et MNVAR sont en O(h) par paire sans recopier les semaines, et les distances initiales sont calculées en un seul appel.'''
 def clustering(dem,methode_distance_cluster='ward'):
-    dem=dem.to_numpy()
+    dem = np.asarray(dem.to_numpy() if hasattr(dem, 'to_numpy') else dem, dtype=float)
     nb_w, nb_heures = dem.shape
-    index_new_cluster=51
+    # Les distances sont invariantes par translation : on centre pour limiter les erreurs d'arrondi de q/n - ||s/n||²
+    dem = dem - dem.mean(axis=0)
+    if methode_distance_cluster not in ('ward', 'MNVAR', 'camille') :
+        print("methode non valide, fin de l_index_cluster'algo")
+        sys.exit()
+
+    # Etat des clusters, indexé par la première semaine du cluster
+    fin      = np.arange(1, nb_w + 1)   # fin[s] : semaine suivant la dernière semaine du cluster (= début du voisin de droite)
+    prec     = np.arange(-1, nb_w - 1)  # prec[s] : première semaine du voisin de gauche (-1 si aucun)
+    taille   = np.ones(nb_w, dtype=int) # Nombre de semaines du cluster
+    somme    = dem.copy()               # Somme des semaines du cluster
+    carres   = np.einsum('ij,ij->i', dem, dem) # Somme des carrés des normes des semaines du cluster
+    index    = np.arange(nb_w)          # Index du cluster au sens de scipy (0..nb_w-1 puis nb_w, nb_w+1, ...)
+    actif    = np.ones(nb_w, dtype=bool)
+    version  = np.zeros(nb_w, dtype=int) # Incrémenté à chaque modification du cluster -> invalide les entrées du tas
+
+    def distance(s1, s2):
+        # Methode de ward
+        if methode_distance_cluster == 'ward' :
+            return float(ward_distance_stats(taille[s1], somme[s1], taille[s2], somme[s2]))
+        # Methode de MNVAR
+        elif methode_distance_cluster == 'MNVAR' :
+            return float(variance_distance_stats(taille[s1], somme[s1], carres[s1], taille[s2], somme[s2], carres[s2]))
+        #Ancienne Methode de Camille (s2 = fin[s1] : le cluster fusionné est la tranche contiguë dem[s1:fin[s2]])
+        else :
+            moy = (somme[s1] + somme[s2]) / (taille[s1] + taille[s2])
+            return float(camille_distance_block(dem[s1:fin[s2]], moy))
+
+    # Tas des distances entre clusters adjacents : (distance, s1, s2, version s1, version s2)
+    d_init = adjacent_distances(dem, taille, somme, carres, methode_distance_cluster)
+    tas = [(float(d_init[s]), s, s + 1, 0, 0) for s in range(nb_w - 1)]
+    heapq.heapify(tas)
+
     # Z liste cluster utilisé classiquement par scipy.cluster.hierarchy
     # Z sera une liste où chaque élément correspond à une fusion entre deux cluster : [Index_cluster1, Index_cluster2, distance_cluster_1_et_2 , nombre_d'element_nouveau_cluster]
-    Z=[]
-    #Liste des index des clusters
-    l_index_cluster=np.arange(nb_w)
-    #Liste des listes des indices de chaque élements des cluster.
-    l_index_weeks_cluster=[[i] for i in range(nb_w)]
-    # l_index_weeks_cluster[i] est les indices des semaines composant le cluster d'indice l_index_cluster[i]
-    for i in range(51) :
-        #Liste des similarités ou listes des ditances entre tout les clusters. l_similarity[i] est la similarité entre cluster_i et cluster_i+1
-        l_similarity= []
-        nb_w, nb_heures = dem.shape
-        for j in range(len(l_index_cluster)-1):
-            l_cluster1=dem[l_index_weeks_cluster[j]]   #Liste des semaines présents dans cluster 1
-            l_cluster2=dem[l_index_weeks_cluster[j+1]] #Liste des semaines présents dans cluster 2
-            # Methode de ward
-            if methode_distance_cluster=='ward' :
-                similarity=ward_distance(l_cluster1,l_cluster2)
-            # Methode de MNVAR
-            elif methode_distance_cluster=='MNVAR' :
-                similarity=variance_distance(l_cluster1,l_cluster2)
-            #Ancienne Methode de Camille
-            elif methode_distance_cluster== 'camille' :
-                similarity=camille_distance(l_index_weeks_cluster[j],l_index_weeks_cluster[j+1],dem)
-            else :
-                print("methode non valide, fin de l_index_cluster'algo")
-                sys.exit()
-            l_similarity.append(similarity)
-        index_min=np.argmin(l_similarity)
-        #Modification de l_index_cluster
-        index_new_cluster+=1
-        index_cluster1=l_index_cluster[index_min] #
-        index_cluster2=l_index_cluster[index_min+1]
-        l_index_cluster=np.delete(l_index_cluster,index_min,axis=0)
-        l_index_cluster=np.delete(l_index_cluster,index_min,axis=0)
-        l_index_cluster=np.insert(l_index_cluster,index_min,index_new_cluster)
-        #Modification de l_index_weeks_cluster
-        index_weeks_cluster1 = l_index_weeks_cluster.pop(index_min) # Liste des index de semaine dans cluster 1
-        index_weeks_cluster2 = l_index_weeks_cluster.pop(index_min) # Liste des index de semaine dans cluster 2
-        index_weeks_fusion = index_weeks_cluster1 + index_weeks_cluster2 #Liste des index des semaine du nouveau cluster formé
-        l_index_weeks_cluster.insert(index_min,index_weeks_fusion)
-        Z.append([index_cluster1,index_cluster2,l_similarity[index_min],len(index_weeks_fusion)])
-    return(Z)
+    Z = []
+    index_new_cluster = nb_w
+    while len(Z) < nb_w - 1 :
+        d, s1, s2, v1, v2 = heapq.heappop(tas)
+        if not (actif[s1] and actif[s2]) or version[s1] != v1 or version[s2] != v2 :
+            continue
+        # Fusion de s2 dans s1
+        n = taille[s1] + taille[s2]
+        Z.append([index[s1], index[s2], d, n])
+        somme[s1] += somme[s2]
+        carres[s1] += carres[s2]
+        taille[s1] = n
+        fin[s1] = fin[s2]
+        actif[s2] = False
+        index[s1] = index_new_cluster
+        index_new_cluster += 1
+        version[s1] += 1
+        # Mise à jour des distances avec les deux voisins
+        if fin[s1] < nb_w :
+            prec[fin[s1]] = s1
+            heapq.heappush(tas, (distance(s1, fin[s1]), s1, fin[s1], version[s1], version[fin[s1]]))
+        if prec[s1] >= 0 :
+            s0 = prec[s1]
+            heapq.heappush(tas, (distance(s0, s1), s0, s1, version[s0], version[s1]))
+    return np.array(Z, dtype=float)
+
+
+# Découpage d'un profil horaire en périodes de period_length heures (jour = 24, demi-semaine = 84, semaine = 168)
+# Les profils multi-années (ex : 30 années météo = 1560 semaines) sont simplement plus longs.
+def reshape_periods(profile, period_length=7*24, number_of_periods=None):
+    """Cut an hourly profile into a [number_of_periods, period_length] matrix (trailing hours are dropped)."""
+    profile = np.asarray(profile, dtype=float).ravel()
+    if number_of_periods is None:
+        number_of_periods = len(profile) // period_length
+    if len(profile) < period_length * number_of_periods:
+        raise ValueError(f"Profile has {len(profile)} hours, {period_length * number_of_periods} needed")
+    return profile[:period_length * number_of_periods].reshape(number_of_periods, period_length)
+
+
+# Cache disque de la liaison Z : Z ne dépend que des données et de la méthode, pas du nombre de clusters.
+# Une fois calculée, R_M4_Demand la coupe avec fcluster pour n'importe quel nombre de semaines représentatives.
+LINKAGE_CACHE_VERSION = 2  # A incrémenter si l'algorithme de clustering change
+
+def linkage_key(dem, methode_distance_cluster='ward'):
+    """Content hash of the clustered matrix and of the distance method."""
+    x = np.ascontiguousarray(dem.to_numpy() if hasattr(dem, 'to_numpy') else dem, dtype=float)
+    h = hashlib.sha256()
+    h.update(f"{LINKAGE_CACHE_VERSION}|{methode_distance_cluster}|{x.shape}".encode())
+    h.update(x.tobytes())
+    return h.hexdigest()
+
+
+def cached_clustering(dem, methode_distance_cluster='ward', cache_dir=None):
+    """clustering() with the linkage stored on disk under cache_dir (no cache if cache_dir is None)."""
+    if cache_dir is None:
+        return clustering(dem, methode_distance_cluster=methode_distance_cluster)
+    path = os.path.join(cache_dir, f"linkage_{linkage_key(dem, methode_distance_cluster)}.npy")
+    if os.path.exists(path):
+        return np.load(path)
+    Z = clustering(dem, methode_distance_cluster=methode_distance_cluster)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp.npy"
+    np.save(tmp, Z)
+    os.replace(tmp, path)
+    return Z
 
 
 def plot_dendrogram(Z, number_of_mean_weeks, distance, methode_distance_cluster):
 
+    nb_periods = len(Z) + 1
     # Créer le dendrogramme avec SciPy
     color_threshold = Z[-number_of_mean_weeks+1, 2]
     dendro = dendrogram(Z, no_plot=True, color_threshold=color_threshold)
@@ -81,9 +163,7 @@ def plot_dendrogram(Z, number_of_mean_weeks, distance, methode_distance_cluster)
                       yaxis=dict(type='log'),showlegend=False)
 
     # Ajouter la ligne horizontale pour le seuil
-    threshold = (-Z[52-2-number_of_mean_weeks, 2]+ 3*Z[52-1-number_of_mean_weeks, 2])/4+Z[52-2-number_of_mean_weeks, 2]
-    #print(Z[52-2-number_of_mean_weeks, 2])
-    #print(Z[52-1-number_of_mean_weeks, 2])
+    threshold = (-Z[nb_periods-2-number_of_mean_weeks, 2]+ 3*Z[nb_periods-1-number_of_mean_weeks, 2])/4+Z[nb_periods-2-number_of_mean_weeks, 2]
     fig.add_hline(y=threshold, line_dash='dash', line_color='red',
                   annotation_text=f"seuil pour {number_of_mean_weeks} dem réprésentatives", annotation_position='top right')
 
@@ -91,7 +171,7 @@ def plot_dendrogram(Z, number_of_mean_weeks, distance, methode_distance_cluster)
 
     # Figure distance - nombre de semaines représentatives
     fig2 = go.Figure()
-    fig2.add_trace(go.Scatter(x=np.arange(51, 0, -1), y=distance, mode='lines'))
+    fig2.add_trace(go.Scatter(x=np.arange(nb_periods-1, 0, -1), y=distance, mode='lines'))
     fig2.add_vline(x=number_of_mean_weeks, line_dash='dash', line_color='red',
                    annotation_text=f"{number_of_mean_weeks} dem réprésentatives", annotation_position='top')
     fig2.update_layout(title="Analyse distance/nombre de dem représentatifs Methode de " + str(methode_distance_cluster),
@@ -105,9 +185,8 @@ def plot_dendrogram(Z, number_of_mean_weeks, distance, methode_distance_cluster)
 
 
 
-def R_M4_Demand(number_of_mean_weeks, dem,print_info=True,methode_distance_cluster='ward'):
-    Z=clustering(dem,methode_distance_cluster=methode_distance_cluster)
-    t= 52 - number_of_mean_weeks
+def R_M4_Demand(number_of_mean_weeks, dem,print_info=True,methode_distance_cluster='ward',cache_dir=None):
+    Z=cached_clustering(dem,methode_distance_cluster=methode_distance_cluster,cache_dir=cache_dir)
     groups=fcluster(Z, number_of_mean_weeks, criterion='maxclust')
     Z = np.array(Z)
     distance=Z[:,2]
@@ -125,3 +204,108 @@ def R_M4_Demand(number_of_mean_weeks, dem,print_info=True,methode_distance_clust
         plot_dendrogram(Z, number_of_mean_weeks, distance, methode_distance_cluster)
 
     return np.array(group_reindexed)
+
+
+# Clustering conjoint de plusieurs signaux (demande + facteurs de charge)
+# Chaque signal est centré-réduit (moyenne et écart type sur tout le signal, la forme des semaines est conservée)
+# puis pondéré par sqrt(poids / nb_colonnes) : sa contribution aux distances ne dépend que de son poids.
+def feature_matrix(signals, weights=None):
+    """Stack several period profiles into one normalized feature matrix.
+
+    Parameters
+    ----------
+    signals : dict[str, DataFrame | np.ndarray]
+        Profiles of shape [n_periods, n_hours] (e.g. demand_reshape, pv_lf_reshape), same n_periods.
+    weights : dict[str, float] | None
+        Weight of each signal (1 if missing).
+
+    Returns
+    -------
+    np.ndarray
+        Matrix [n_periods, sum of n_hours].
+    """
+    weights = weights or {}
+    blocks = []
+    for name, sig in signals.items():
+        x = np.asarray(sig.to_numpy() if hasattr(sig, 'to_numpy') else sig, dtype=float)
+        std = x.std()
+        x = (x - x.mean()) / (std if std > 0 else 1.0)
+        blocks.append(x * np.sqrt(weights.get(name, 1.0) / x.shape[1]))
+    if len({b.shape[0] for b in blocks}) != 1:
+        raise ValueError("All signals must have the same number of periods")
+    return np.hstack(blocks)
+
+
+def R_M4_Joint(number_of_mean_weeks, signals, weights=None, print_info=True, methode_distance_cluster='ward', cache_dir=None):
+    """Representative weeks from the joint clustering of several signals (same output as R_M4_Demand)."""
+    return R_M4_Demand(number_of_mean_weeks, feature_matrix(signals, weights),
+                       print_info=print_info, methode_distance_cluster=methode_distance_cluster, cache_dir=cache_dir)
+
+
+# Balayage du nombre de semaines représentatives à partir d'une seule liaison Z
+# Pour chaque k, chaque semaine est remplacée par le représentant de son cluster et on compare au signal d'origine :
+#   - dc_nrmse   : RMSE entre monotones (courbes de durée) / moyenne du signal
+#   - energy_err : écart relatif d'énergie annuelle
+#   - peak_err   : écart relatif de pointe
+# Le représentant est la moyenne du cluster ('mean', comme la demande) ou une semaine du cluster choisie
+# sur son énergie ('medium', 'high', 'low', avec select_weeks comme les facteurs de charge des templates).
+def _cluster_representatives(x, labels, k, mode):
+    counts = np.bincount(labels, minlength=k)
+    if mode == 'mean':
+        rep = np.zeros((k, x.shape[1]))
+        np.add.at(rep, labels, x)
+        return rep / counts[:, None]
+    return x[select_weeks(x, labels, k, mode)]
+
+
+def sweep_representative_weeks(Z, signals, selection=None, k_values=None):
+    """Error metrics of every number of representative weeks cut from one linkage.
+
+    Parameters
+    ----------
+    Z : np.ndarray
+        Linkage returned by clustering() / cached_clustering().
+    signals : dict[str, DataFrame | np.ndarray]
+        Profiles [n_periods, n_hours] to evaluate (demand, pv, won, ...).
+    selection : dict[str, str] | None
+        Representative of each signal: 'mean' (default), 'medium', 'high' or 'low'.
+    k_values : iterable[int] | None
+        Numbers of clusters to evaluate, 1..n_periods-1 by default.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per k, columns '<signal>_dc_nrmse', '<signal>_energy_err', '<signal>_peak_err'.
+    """
+    Z = np.asarray(Z, dtype=float)
+    n = Z.shape[0] + 1
+    selection = selection or {}
+    k_values = range(1, n) if k_values is None else k_values
+    data = {name: np.asarray(sig.to_numpy() if hasattr(sig, 'to_numpy') else sig, dtype=float)
+            for name, sig in signals.items()}
+    ref = {name: (np.sort(x.ravel())[::-1], x.sum(), x.max(), np.abs(x).mean()) for name, x in data.items()}
+
+    rows = []
+    for k in k_values:
+        labels = fcluster(Z, k, criterion='maxclust') - 1
+        k_eff = labels.max() + 1
+        row = {'k': k}
+        for name, x in data.items():
+            rec = _cluster_representatives(x, labels, k_eff, selection.get(name, 'mean'))[labels]
+            dc, energy, peak, scale = ref[name]
+            row[f"{name}_dc_nrmse"] = np.sqrt(np.mean((np.sort(rec.ravel())[::-1] - dc) ** 2)) / scale
+            row[f"{name}_energy_err"] = (rec.sum() - energy) / energy
+            row[f"{name}_peak_err"] = (rec.max() - peak) / peak
+        rows.append(row)
+    return pd.DataFrame(rows).set_index('k')
+
+
+def smallest_number_of_weeks(table, tolerances):
+    """Smallest k of a sweep table whose metrics all satisfy |value| <= tolerance (None if none does).
+
+    tolerances : dict[str, float], e.g. {'demand_peak_err': 0.05, 'pv_energy_err': 0.02}
+    """
+    ok = np.ones(len(table), dtype=bool)
+    for column, tol in tolerances.items():
+        ok &= table[column].abs().to_numpy() <= tol
+    return int(table.index[ok][0]) if ok.any() else None
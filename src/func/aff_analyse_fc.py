@@ -1,5 +1,4 @@
 import numpy as np
-import copy
 import plotly.graph_objects as go
 
 
@@ -15,8 +14,8 @@ def aff_analyse_fc(dict_lf,
 
     Parameters
     ----------
-    dict_lf : dict[(int,int,int), float]
-        Mapping (year, week, hour) -> load factor.
+    dict_lf : series_ywh
+        Load factor indexed by (year, week, hour).
     weight_week_dict : dict[int,int]
         Representative week weights.
     type_energy : str
@@ -24,13 +23,9 @@ def aff_analyse_fc(dict_lf,
     year : int | None
         Year to display weekly average. If None, first year in global 'years' sequence is used.
     """
-    dict1 = copy.deepcopy(dict_lf)
-
     # Select deterministic year
     year_number = year if year is not None else (years[0] if hasattr(years, '__getitem__') else list(years)[0])
-    average_week_values = [
-        np.sum(dict1[(year_number, w, h)] for h in hours) / 168 for w in weeks
-    ]
+    average_week_values = dict_lf.year(year_number).mean(axis=1).tolist()
 
     fig_input[type_energy + 'plot 1'] = go.Figure()
     fig_input[type_energy + 'plot 1'].add_trace(
@@ -44,10 +39,8 @@ def aff_analyse_fc(dict_lf,
     )
 
     # Annual averages over scenario years
-    average_years_values = [
-        np.sum(dict1[(y, w, h)] * weight_week_dict[w] for w in weeks for h in hours) / (52 * 168)
-        for y in years
-    ]
+    week_weights = np.array([weight_week_dict[w] for w in weeks])
+    average_years_values = ((dict_lf.to_numpy() * week_weights[None, :, None]).sum(axis=(1, 2)) / (week_weights.sum() * len(hours))).tolist()
     total_average = float(np.mean(average_years_values))
 
     fig_input[type_energy + 'plot 2'] = go.Figure()
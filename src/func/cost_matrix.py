@@ -0,0 +1,26 @@
+import numpy as np
+
+
+def cost_matrix(techno, cost='var_tot', years=None):
+    """Stack one prm_eco cost series of every techno into a [n_techno, n_years] array.
+
+    Parameters
+    ----------
+    techno : dict[int, Techno]
+        Technologies of the scenario.
+    cost : str
+        prm_eco getter without its ``get_`` prefix ('var_tot', 'cost_profile_fix', 'fix_om', ...).
+    years : range | None
+        Years kept as columns. If None, the full axis of the series (years_world).
+
+    Returns
+    -------
+    (list[int], np.ndarray)
+        Techno indices in row order and the cost matrix.
+    """
+    keys = list(techno.keys())
+    rows = []
+    for i in keys:
+        series = getattr(techno[i].get_eco(), 'get_' + cost)()
+        rows.append(series.to_numpy() if years is None else series.select(years))
+    return keys, np.vstack(rows)
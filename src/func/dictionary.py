@@ -26,4 +26,68 @@ def create_val_dictionary(known_vals: Sequence[float] | None,
         raise ValueError("known_vals and known_years must have same length")
     # Linear interpolation over the domain of all_years
     interpolated_vals = np.interp(all_years, known_years, known_vals)
-    return dict(zip(all_years, interpolated_vals))
\ No newline at end of file
+    return dict(zip(all_years, interpolated_vals))
+
+def interpolate_batch(series: Sequence[tuple[Sequence[int] | None, Sequence[float] | None]] | Mapping,
+                      all_years: Sequence[int],
+                      as_dict: bool = False):
+    """Interpolate many series onto one year axis in a single vectorized pass.
+
+    Same rule as ``create_val_dictionary`` for each series (linear interpolation, constant
+    beyond the known years, zeros when no data).
+
+    Parameters
+    ----------
+    series : sequence of (known_years, known_vals) | mapping name -> (known_years, known_vals)
+        Known points of each series (sequences or arrays of the same length); known_years must be increasing.
+    all_years : sequence of int
+        Target year vector, shared by all series.
+    as_dict : bool
+        Also return a dict view {year: value} of each series.
+
+    Returns
+    -------
+    np.ndarray
+        Array [n_series, n_years], rows in the order of ``series``.
+    list[dict] | dict[name, dict]
+        Only when as_dict: dict views, keyed like ``series`` when it is a mapping.
+    """
+    names = list(series.keys()) if isinstance(series, Mapping) else None
+    items = list(series.values()) if names is not None else list(series)
+    x = np.asarray(all_years, dtype=float)
+    out = np.zeros((len(items), len(x)))
+
+    # Séries sans données (None ou vide, listes ou tableaux NumPy) -> zéros
+    lengths = np.zeros(len(items), dtype=int)
+    for i, (yrs, vals) in enumerate(items):
+        if yrs is None or vals is None or len(yrs) == 0 or len(vals) == 0:
+            continue
+        if len(yrs) != len(vals):
+            raise ValueError(f"known_vals and known_years must have same length (series {names[i] if names else i})")
+        lengths[i] = len(yrs)
+    rows = np.flatnonzero(lengths)
+    if len(rows):
+        # Points connus complétés par +inf (années) pour former des matrices [n_series, max_points]
+        m = lengths.max()
+        K = np.full((len(rows), m), np.inf)
+        V = np.zeros((len(rows), m))
+        for j, i in enumerate(rows):
+            K[j, :lengths[i]] = items[i][0]
+            V[j, :lengths[i]] = items[i][1]
+        n = lengths[rows]
+        last = K[np.arange(len(rows)), n - 1]
+        xc = np.clip(x[None, :], K[:, :1], last[:, None])
+        # Segment [k0, k1] contenant chaque année (le dernier segment pour la dernière année connue)
+        seg = (K[:, :, None] <= xc[:, None, :]).sum(axis=1) - 1
+        seg = np.minimum(seg, np.maximum(n - 2, 0)[:, None])
+        nxt = np.minimum(seg + 1, (n - 1)[:, None])
+        k0, k1 = np.take_along_axis(K, seg, 1), np.take_along_axis(K, nxt, 1)
+        v0, v1 = np.take_along_axis(V, seg, 1), np.take_along_axis(V, nxt, 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(k1 > k0, (v1 - v0) / (k1 - k0), 0.0)
+        out[rows] = np.where(xc == k1, v1, slope * (xc - k0) + v0)
+
+    if not as_dict:
+        return out
+    views = [dict(zip(all_years, row)) for row in out]
+    return out, (dict(zip(names, views)) if names is not None else views)
@@ -29,31 +29,83 @@ def variance_distance(cl1, cl2):
     Returns:
     float: La variance intraclasse du cluster fusionné.
     """
-    # Fusionner les deux clusters
-    combined_cluster = np.vstack((cl1, cl2))
-    # Calculer le centroïde du cluster fusionné
-    mu_combined = np.mean(combined_cluster, axis=0)
-    # Calculer la variance intraclasse du cluster fusionné
-    variance = np.mean(np.linalg.norm(combined_cluster - mu_combined, axis=1)**2)
-    return variance
+    # Les deux clusters ne sont pas recopiés : on passe par leurs statistiques suffisantes
+    return float(variance_distance_stats(*cluster_stats(cl1), *cluster_stats(cl2)))
 def camille_distance(index_cl1,index_cl2,dem) :
-    index_cluster_theorique=index_cl1 + index_cl2
-    moy_cluster=np.array([])
-    Matrice_cluster_therorique=[]
-    for i in index_cluster_theorique :
-        Matrice_cluster_therorique=Matrice_cluster_therorique + [dem[i]]
-    moy_cluster=np.mean(Matrice_cluster_therorique, axis=0)
-    moy_distance=0
-    for i in index_cluster_theorique :
-        moy_distance += np.linalg.norm(dem[i] - moy_cluster)
-    similarity=moy_distance/len(index_cluster_theorique)
-    return(similarity)
-
-
-
-
-
+    """
+    Distance moyenne (non quadratique) des semaines du cluster fusionné à son centroïde.
+    Parameters:
+    index_cl1 (list): Index des semaines du premier cluster.
+    index_cl2 (list): Index des semaines du deuxième cluster.
+    dem (np.ndarray): Un tableau de taille (nb_semaines, n) des profils.
+    Returns:
+    float: La distance moyenne au centroïde du cluster fusionné.
+    """
+    matrice_cluster = np.asarray(dem)[list(index_cl1) + list(index_cl2)]
+    return float(camille_distance_block(matrice_cluster, matrice_cluster.mean(axis=0)))
 
 
+# Statistiques suffisantes d'un cluster : taille n, somme des points s (vecteur) et somme des carrés q (scalaire).
+# Ward et MNVAR se calculent en O(h) à partir de ces statistiques, sans recopier les points.
+# Les fonctions *_stats acceptent aussi des tableaux (n de taille (m,), s de taille (m, h)) pour évaluer m paires d'un coup.
+def cluster_stats(cl):
+    """
+    Statistiques suffisantes d'un cluster.
+    Parameters:
+    cl (np.ndarray): Un tableau de taille (n1, n) représentant les points du cluster.
+    Returns:
+    tuple: (taille, somme des points, somme des carrés des normes).
+    """
+    cl = np.atleast_2d(np.asarray(cl, dtype=float))
+    return cl.shape[0], cl.sum(axis=0), float(np.einsum('ij,ij->', cl, cl))
+def ward_distance_stats(n1, s1, n2, s2):
+    """
+    Distance de Ward à partir des statistiques suffisantes des deux clusters.
+    """
+    n1 = np.asarray(n1, dtype=float)
+    n2 = np.asarray(n2, dtype=float)
+    diff = s1 / n1[..., None] - s2 / n2[..., None]
+    return (n1 * n2) / (n1 + n2) * np.einsum('...i,...i->...', diff, diff)
+def variance_distance_stats(n1, s1, q1, n2, s2, q2):
+    """
+    Variance intraclasse du cluster fusionné à partir des statistiques suffisantes : q/n - ||s/n||².
+    """
+    n = np.asarray(n1, dtype=float) + n2
+    mu = (s1 + s2) / n[..., None]
+    return (q1 + q2) / n - np.einsum('...i,...i->...', mu, mu)
+def camille_distance_block(matrice_cluster, moy_cluster):
+    """
+    Distance moyenne des points d'un bloc à un centroïde donné.
+    La distance de Camille n'est pas quadratique : elle ne se déduit pas des statistiques suffisantes
+    et reste en O(n1 * h), mais le bloc peut être une vue (tranche contiguë) sans copie.
+    """
+    return np.linalg.norm(matrice_cluster - moy_cluster, axis=1).mean()
 
 
+def adjacent_distances(dem, taille, somme, carres, methode_distance_cluster='ward'):
+    """
+    Distances entre toutes les paires de clusters adjacents en un seul appel NumPy.
+    Parameters:
+    dem (np.ndarray): Un tableau de taille (nb_semaines, n) des profils, clusters contigus dans l'ordre.
+    taille (np.ndarray): Taille des m clusters, dans l'ordre temporel.
+    somme (np.ndarray): Un tableau de taille (m, n) des sommes des points de chaque cluster.
+    carres (np.ndarray): Sommes des carrés des normes de chaque cluster (inutilisé pour ward et camille).
+    Returns:
+    np.ndarray: Les m-1 distances entre les clusters k et k+1.
+    """
+    taille = np.asarray(taille)
+    if methode_distance_cluster == 'ward':
+        return ward_distance_stats(taille[:-1], somme[:-1], taille[1:], somme[1:])
+    if methode_distance_cluster == 'MNVAR':
+        return variance_distance_stats(taille[:-1], somme[:-1], carres[:-1], taille[1:], somme[1:], carres[1:])
+    # Camille : chaque semaine appartient à deux paires (avec son voisin de gauche et avec celui de droite)
+    m = len(taille)
+    n_paire = taille[:-1] + taille[1:]
+    moy = (somme[:-1] + somme[1:]) / n_paire[:, None]
+    cluster = np.repeat(np.arange(m), taille)
+    total = np.zeros(m - 1)
+    gauche = cluster < m - 1
+    total += np.bincount(cluster[gauche], weights=np.linalg.norm(dem[gauche] - moy[cluster[gauche]], axis=1), minlength=m - 1)
+    droite = cluster > 0
+    total += np.bincount(cluster[droite] - 1, weights=np.linalg.norm(dem[droite] - moy[cluster[droite] - 1], axis=1), minlength=m - 1)
+    return total / n_paire
@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Semaines représentatives par k-medoids
+# Contrairement à R_M4_Demand, les clusters ne sont pas contraints à des semaines consécutives :
+# chaque semaine est rattachée au medoid (semaine réelle) le plus proche, sur une matrice de distances précalculée.
+# L'algorithme alterne affectation et recherche du medoid de chaque cluster, à partir d'une initialisation k-medoids++.
+# Plusieurs initialisations aléatoires sont lancées (éventuellement en parallèle) et la meilleure est retenue.
+
+
+def pairwise_distances(dem, metric='euclidean'):
+    """Distance matrix [n_periods, n_periods] between period profiles.
+
+    Parameters
+    ----------
+    dem : DataFrame | np.ndarray
+        Profiles of shape [n_periods, n_hours] (e.g. demand_reshape or feature_matrix(...)).
+    metric : str
+        'euclidean' or 'sqeuclidean' (the latter is closer to the Ward criterion of R_M4_Demand).
+    """
+    x = np.asarray(dem.to_numpy() if hasattr(dem, 'to_numpy') else dem, dtype=float)
+    x = x - x.mean(axis=0)
+    sq = np.einsum('ij,ij->i', x, x)
+    D = np.maximum(sq[:, None] + sq[None, :] - 2 * (x @ x.T), 0.0)
+    np.fill_diagonal(D, 0.0)
+    if metric == 'sqeuclidean':
+        return D
+    if metric == 'euclidean':
+        return np.sqrt(D)
+    raise ValueError(f"Unknown metric {metric}")
+
+
+def _kmedoids_init(D, k, rng):
+    # Initialisation k-medoids++ : chaque nouveau medoid est tiré proportionnellement à la distance au medoid le plus proche
+    n = D.shape[0]
+    medoids = [int(rng.integers(n))]
+    d_min = D[medoids[0]].copy()
+    for _ in range(1, k):
+        total = d_min.sum()
+        i = int(rng.choice(n, p=d_min / total)) if total > 0 else int(rng.choice(np.setdiff1d(np.arange(n), medoids)))
+        medoids.append(i)
+        d_min = np.minimum(d_min, D[i])
+    return np.array(medoids)
+
+
+def _kmedoids_single(D, k, seed, max_iter=100):
+    """One k-medoids run from a k-medoids++ initialisation. Returns (cost, medoids, labels)."""
+    rng = np.random.default_rng(seed)
+    medoids = _kmedoids_init(D, k, rng)
+    for _ in range(max_iter):
+        labels = np.argmin(D[:, medoids], axis=1)
+        new_medoids = medoids.copy()
+        for c in range(k):
+            members = np.flatnonzero(labels == c)
+            if len(members):
+                new_medoids[c] = members[np.argmin(D[np.ix_(members, members)].sum(axis=0))]
+        if np.array_equal(np.sort(new_medoids), np.sort(medoids)):
+            break
+        medoids = new_medoids
+    labels = np.argmin(D[:, medoids], axis=1)
+    cost = float(D[np.arange(len(labels)), medoids[labels]].sum())
+    return cost, medoids, labels
+
+
+# La matrice de distances est envoyée une seule fois à chaque processus (et non à chaque initialisation)
+_worker_D = None
+
+def _init_worker(D):
+    global _worker_D
+    _worker_D = D
+
+def _worker_run(args):
+    k, seed, max_iter = args
+    return _kmedoids_single(_worker_D, k, seed, max_iter)
+
+
+def kmedoids(D, k, n_init=10, seed=0, n_jobs=1, max_iter=100):
+    """Best of n_init k-medoids runs on the distance matrix D.
+
+    Each run gets its own child seed of ``seed``, so the result does not depend on n_jobs.
+    With n_jobs > 1 the runs are spread over a process pool.
+
+    Returns
+    -------
+    tuple
+        (cost, medoids, labels) of the lowest-cost run; labels[i] is the position in ``medoids``
+        of the medoid of period i.
+    """
+    D = np.asarray(D, dtype=float)
+    if not 1 <= k <= D.shape[0]:
+        raise ValueError(f"k must be between 1 and {D.shape[0]}, got {k}")
+    seeds = np.random.SeedSequence(seed).spawn(n_init)
+    if n_jobs == 1:
+        runs = [_kmedoids_single(D, k, s, max_iter) for s in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(D,)) as executor:
+            runs = list(executor.map(_worker_run, [(k, s, max_iter) for s in seeds]))
+    # min sur le coût uniquement : en cas d'égalité la première initialisation est retenue
+    return min(runs, key=lambda run: run[0])
+
+
+def R_KMedoids(number_of_mean_weeks, dem, print_info=True, metric='euclidean', n_init=10, seed=0, n_jobs=1):
+    """Representative weeks by k-medoids (same output format as R_M4_Demand).
+
+    Returns the ``group`` array: group[i] is the representative week (0..number_of_mean_weeks-1) of
+    period i. Groups are numbered by their medoid in time order.
+    """
+    D = pairwise_distances(dem, metric)
+    cost, medoids, labels = kmedoids(D, number_of_mean_weeks, n_init=n_init, seed=seed, n_jobs=n_jobs)
+    order = np.argsort(medoids)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    group = rank[labels]
+    if print_info:
+        sizes = np.bincount(group, minlength=number_of_mean_weeks)
+        print(f"k-medoids ({metric}, {n_init} restarts): cost = {cost:.4g}")
+        for w, (m, s) in enumerate(zip(medoids[order], sizes)):
+            print(f"  representative week {w}: medoid = period {m}, {s} periods")
+    return group
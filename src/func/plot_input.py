@@ -10,6 +10,11 @@ except Exception:
     # Fallback when executed via %run without package context
     from aff_analyse_fc import aff_analyse_fc
 
+try:
+    from .screening import screening_costs, lower_envelope, HOURS_PER_YEAR
+except Exception:
+    from screening import screening_costs, lower_envelope, HOURS_PER_YEAR
+
 plot_input_flag = globals().get('plot_input', False)
 
 if plot_input_flag:
@@ -61,12 +66,9 @@ if plot_input_flag:
     key = 'demand'
     if Display_input['demand']:
         demand_y = {}
-        unique, counts = np.unique(group, return_counts=True)
+        week_weights = np.array([weight_week_dict[w] for w in weeks])
         for y in years:
-            demand_y_tmp = 0    
-            for w in weeks:
-                demand_y_tmp += counts[w-1] * sum(value for (yy, ww, hh), value in demand_dict.items() if yy == y and ww == w)
-            demand_y[y] = demand_y_tmp / 1e6 # => to get TWh
+            demand_y[y] = (week_weights[:, None] * demand_dict.year(y)).sum() / 1e6 # => to get TWh
 
         fig_input[key] = go.Figure()
         fig_input[key].add_trace(
@@ -104,18 +106,32 @@ if plot_input_flag:
     key = 'tot_costs'
     if Display_input[key] :
         fig_input[key] = go.Figure()
-        for t in techno.keys():
-            U = np.arange(1, 8761, 1)
+        # Screening curves of every techno for the reference year, computed at once [techno, 1, hours of use]
+        U = np.arange(1, HOURS_PER_YEAR + 1, 1)
+        keys_tot, costs_tot = screening_costs(techno, [reference_year], U)
+        for row, t in enumerate(keys_tot):
             n = techno[t].get_name() + ' ' + techno[t].get_title()
             fig_input[key].add_trace(
                 go.Scatter(
                     x=U,
-                    y=techno[t].get_eco().get_cost_profile_tot(reference_year),
+                    y=costs_tot[row, 0],
                     line=dict(width=2.0, shape='hv'),
                     mode='lines',
                     name=n
                 )
             )
+        rows_disp = [row for row, t in enumerate(keys_tot) if techno[t].get_type() == 'dispatchable']
+        if rows_disp:
+            _, envelope_tot = lower_envelope(costs_tot[rows_disp])
+            fig_input[key].add_trace(
+                go.Scatter(
+                    x=U,
+                    y=envelope_tot[0],
+                    line=dict(width=3.0, color='black', dash='dot'),
+                    mode='lines',
+                    name='Lower envelope (dispatchable)'
+                )
+            )
         apply_layout(
             fig_input[key],
             title=f"Total cost profile — {reference_year}",
@@ -217,6 +233,7 @@ if plot_input_flag:
     key = 'week_pv'
     if Display_input[key] :
         fig_input[key] = go.Figure()
+        pv_lf_new = pd.DataFrame(dict_pv_lf.year(reference_year))
         for index, row in pv_lf_new.iterrows():
             fig_input[key].add_trace(
                 go.Scatter(
@@ -243,6 +260,7 @@ if plot_input_flag:
     key = 'week_won'
     if Display_input[key] :
         fig_input[key] = go.Figure()
+        won_lf_new = pd.DataFrame(dict_won_lf.year(reference_year))
         for index, row in won_lf_new.iterrows():
             fig_input[key].add_trace(
                 go.Scatter(
@@ -270,6 +288,7 @@ if plot_input_flag:
     if Display_input[key] :
     
         fig_input[key] = go.Figure()
+        wof_lf_new = pd.DataFrame(dict_wof_lf.year(reference_year))
         for index, row in wof_lf_new.iterrows():
             fig_input[key].add_trace(
                 go.Scatter(
@@ -320,11 +339,11 @@ if plot_input_flag:
         ##"##### Eolien Onshore ### 
      
         fig_input[key + 'plot 1'] = go.Figure()
-        fig_input[key + 'plot 1'].add_trace(go.Scatter(x=list(range(1,52)), y=np.array(won_lf_weekmean), mode='lines', name="Weekly mean", line=dict(width=2)))
+        fig_input[key + 'plot 1'].add_trace(go.Scatter(x=list(range(1,len(won_lf_weekmean)+1)), y=np.array(won_lf_weekmean), mode='lines', name="Weekly mean", line=dict(width=2)))
 
         fig_input[key + 'plot 1'].add_trace(
             go.Scatter(
-                x=[0,52],
+                x=[0,len(won_lf_weekmean)],
                 y=[won_lf_yearmean, won_lf_yearmean],
                 name="Annual mean",
                 line=dict(color="#ef4444", width=2, dash="dot")
@@ -353,11 +372,11 @@ if plot_input_flag:
         ##### Eolien Offshore ## 
      
         fig_input[key + 'plot 2'] = go.Figure()
-        fig_input[key + 'plot 2'].add_trace(go.Scatter(x=list(range(1,52)), y=np.array(wof_lf_weekmean), mode='lines', name="Weekly mean", line=dict(width=2)))
+        fig_input[key + 'plot 2'].add_trace(go.Scatter(x=list(range(1,len(wof_lf_weekmean)+1)), y=np.array(wof_lf_weekmean), mode='lines', name="Weekly mean", line=dict(width=2)))
 
         fig_input[key + 'plot 2'].add_trace(
             go.Scatter(
-                x=[0,52],
+                x=[0,len(wof_lf_weekmean)],
                 y=[wof_lf_yearmean, wof_lf_yearmean],
                 name="Annual mean",
                 line=dict(color="#ef4444", width=2, dash="dot")
@@ -386,7 +405,7 @@ if plot_input_flag:
     ##### Eolien Onshore ## 
     
         fig_input[key + 'plot 3'] = go.Figure()
-        fig_input[key + 'plot 3'].add_trace(go.Scatter(x=list(range(1, len(pv_lf_weekmean))), y=np.array(pv_lf_weekmean), mode='lines', name="Weekly mean", line=dict(width=2)))
+        fig_input[key + 'plot 3'].add_trace(go.Scatter(x=list(range(1, len(pv_lf_weekmean)+1)), y=np.array(pv_lf_weekmean), mode='lines', name="Weekly mean", line=dict(width=2)))
 
         fig_input[key + 'plot 3'].add_trace(
             go.Scatter(
@@ -1,6 +1,7 @@
 if plot_output:
 
     fig_output = {}
+    week_weights = np.array([weight_week_dict[w] for w in weeks])  # Weight of each representative week
     
     ################################################
     # Plotting Production
@@ -23,8 +24,8 @@ if plot_output:
                         week = 1
                         year += 1
                     # Ajout des valeurs et des axes x pour chaque semaine
-                    vals += [t.get_tech().get_E()[(year,week,h)] for h in hours]
-                    x += [h + i * 168 for h in hours]
+                    vals += t.get_tech().get_E().week(year, week).tolist()
+                    x += [h + i * len(hours) for h in hours]
                     week += 1
                 fig_output[key].add_trace(go.Scatter(x=x,y=vals,stackgroup='one',line=dict(width=0.2),name=name))
     
@@ -41,8 +42,8 @@ if plot_output:
                         week = 1
                         year += 1
                     # Ajout des valeurs et des axes x pour chaque semaine
-                    vals += [t.get_tech().get_E()[(year,week,h)] for h in hours]
-                    x += [h + i * 168 for h in hours]
+                    vals += t.get_tech().get_E().week(year, week).tolist()
+                    x += [h + i * len(hours) for h in hours]
                     week+=1
                 fig_output[key].add_trace(go.Scatter(x=x,y=vals,stackgroup='one',line=dict(width=0.2),name=name))
     
@@ -57,19 +58,19 @@ if plot_output:
             if week > number_of_mean_weeks:
                 week = 1
                 year += 1
-            vals += [demand_dict[(year,week,h)]for h in hours]
-            x += [h + i * 168 for h in hours]
+            vals += demand_dict.week(year, week).tolist()
+            x += [h + i * len(hours) for h in hours]
             # Ajout du texte de l'annotation pour l'axe x
             annotations_text.append(f"Y : {year}, W : {week}<br> Poids :198 {weight_week_dict[week]}")
             # Ajout de lignes horizontales en pointillé pour chaque semaine
             ligneH.append(dict(
-                type="line",x0=i * 168,y0=100000 ,x1=i * 168,y1=0,xref='x',yref='y',line=dict(color="red",width=2,dash="dot",)))
+                type="line",x0=i * len(hours),y0=100000 ,x1=i * len(hours),y1=0,xref='x',yref='y',line=dict(color="red",width=2,dash="dot",)))
             week+=1
         # Création des annotations pour l'axe x
         annotations = []
         for i, text in enumerate(annotations_text):
             annotations.append(
-                dict(x=i * 168 + 84,y=-0.1,xref="x",yref="paper",text=text,showarrow=False,xanchor='center',font=dict(size=15)))
+                dict(x=i * len(hours) + len(hours) / 2,y=-0.1,xref="x",yref="paper",text=text,showarrow=False,xanchor='center',font=dict(size=15)))
     
         fig_output[key].add_trace(go.Scatter(x=x,y=vals,mode='lines',line=dict(width=2.0),opacity=0.50,name='Demand'))
         fig_output[key].update_layout(title=f"Optimal Mix - PRODUCTION",
@@ -111,18 +112,18 @@ if plot_output:
                         year += 1
                     # Ajout des valeurs et des axes x pour chaque semaine
                     vals += [Stockage[year, week, h] for h in hours]
-                    x += [h + i * 168 for h in hours]
+                    x += [h + i * len(hours) for h in hours]
                     # Ajout du texte de l'annotation pour l'axe x
                     annotations_text.append(f" Y : {year}, W : {week}<br> Poids : {weight_week_dict[week]}")
                     # Ajout de lignes horizontales en pointillé pour chaque semaine
-                    ligneH.append(dict(type="line",x0=i * 168,y0=500000 ,x1=i * 168,y1=0,xref='x',yref='y',line=dict(color="red",width=2,dash="dot")))
+                    ligneH.append(dict(type="line",x0=i * len(hours),y0=500000 ,x1=i * len(hours),y1=0,xref='x',yref='y',line=dict(color="red",width=2,dash="dot")))
                     week += 1
                 # Ajout de la trace
                 fig_output[key].add_trace(go.Scatter(x=x, y=vals, mode='lines', line=dict(width=2.0), opacity=0.50, name='Stockage'))
                 # Création des annotations pour l'axe x
                 annotations = []
                 for i, text in enumerate(annotations_text):
-                    annotations.append(dict(x=i * 168 + 84,y=-0.1,xref="x",yref="paper",text=text,showarrow=False,xanchor='center',font=dict(size=15)))
+                    annotations.append(dict(x=i * len(hours) + len(hours) / 2,y=-0.1,xref="x",yref="paper",text=text,showarrow=False,xanchor='center',font=dict(size=15)))
                 # Mise à jour du layout de la fig_output[key]ure
                 fig_output[key].update_layout(
                     title="Parc Optimal - STORAGE " + name,
@@ -130,7 +131,7 @@ if plot_output:
                     xaxis_title=None,
                     xaxis = dict(tickvals=[],ticktext=[],showticklabels=False),
                     #dict(
-                     #   tickvals=[i * 168 + 84 for i in range(nombre_week_affichage)],
+                     #   tickvals=[i * len(hours) + len(hours) / 2 for i in range(nombre_week_affichage)],
                       #  ticktext=annotations_text,tickangle=-90
                     #),
                     width=800,height=500,margin=dict(l=50, r=150, b=50, t=50),font=dict(size=18),
@@ -173,8 +174,7 @@ if plot_output:
         total_per_year = {year: 0 for year in years}
         for y in years:
             for t in techno.values():
-                vals_list = [t.get_tech().get_E()[(y, w, h)]*weight_week_dict[w] for w in weeks for h in hours]
-                total_per_year[y] += sum(vals_list)
+                total_per_year[y] += (t.get_tech().get_E().year(y) * week_weights[:, None]).sum()
         # Boucle sur les éléments du dictionnaire 'techno'
         for i, t in techno.items():
             if not t.get_type()=='storage' :
@@ -182,8 +182,7 @@ if plot_output:
                 x = [y for y in years]
                 vals = []  # Initialiser 'vals' pour chaque 'name'
                 for y in years:
-                    vals_list = [t.get_tech().get_E()[(y, w, h)]*weight_week_dict[w] for w in weeks for h in hours]
-                    total_val = sum(vals_list)
+                    total_val = (t.get_tech().get_E().year(y) * week_weights[:, None]).sum()
                     vals.append(total_val)
                 fig_output[key].add_trace(go.Bar(x=x, y=vals, name=n))
         # Mettre à jour le layout du diagramme
@@ -215,8 +214,7 @@ if plot_output:
         total_per_year = {year: 0 for year in years}
         for y in years:
             for t in techno.values():
-                vals_list = [t.get_tech().get_E()[(y, w, h)]*weight_week_dict[w] for w in weeks for h in hours]
-                total_per_year[y] += sum(vals_list)
+                total_per_year[y] += (t.get_tech().get_E().year(y) * week_weights[:, None]).sum()
         # Boucle sur les éléments du dictionnaire 'techno'
         for i, t in techno.items():
             if not t.get_type()=='storage' :
@@ -224,8 +222,7 @@ if plot_output:
                 x = [y for y in years]
                 vals = []  # Initialiser 'vals' pour chaque 'name'
                 for y in years:
-                    vals_list = [t.get_tech().get_E()[(y, w, h)]*weight_week_dict[w] for w in weeks for h in hours]
-                    total_val = sum(vals_list)
+                    total_val = (t.get_tech().get_E().year(y) * week_weights[:, None]).sum()
                     percentage_val = (total_val / total_per_year[y]) * 100  # Calculer le pourcentage
                     vals.append(percentage_val)
                 fig_output[key].add_trace(go.Bar(x=x, y=vals, name=n))
@@ -0,0 +1,100 @@
+import json
+import os
+
+import numpy as np
+
+# Stockage binaire des profils horaires (demande, facteurs de charge)
+# Les fichiers texte (.inc) sont convertis une fois en .npy (float64) puis ouverts en mémoire mappée :
+# plus de parsing texte ni de listes Python à chaque chargement, seules les heures lues sont chargées.
+# Plusieurs profils (ex : 30 années météo pv/won/wof) peuvent être regroupés dans une archive :
+#   <archive>.npy  : tous les profils bout à bout
+#   <archive>.json : index {nom: {"offset": ..., "length": ...}}
+# Un profil d'archive se désigne par '<archive>.npy::<nom>', partout où un chemin de profil est attendu.
+ARCHIVE_SEPARATOR = '::'
+
+
+def _save_npy(path, data):
+    # Ecriture atomique : un autre processus ne lit jamais un fichier partiel
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        np.save(f, np.ascontiguousarray(data, dtype=float))
+    os.replace(tmp, path)
+
+
+def convert_profile(path, out_path=None):
+    """Convert a text profile into a .npy file (``<path>.npy`` by default) and return its path."""
+    out_path = out_path or path + '.npy'
+    _save_npy(out_path, np.loadtxt(path, dtype=float).ravel())
+    return out_path
+
+
+def write_archive(profiles, archive_path):
+    """Store several profiles in one archive.
+
+    Parameters
+    ----------
+    profiles : dict[str, str | np.ndarray]
+        Profile name -> text/.npy path or array.
+    archive_path : str
+        Path of the archive data file (.npy); the name index is written next to it as .json.
+    """
+    index, blocks, offset = {}, [], 0
+    for name, profile in profiles.items():
+        if ARCHIVE_SEPARATOR in name:
+            raise ValueError(f"Profile name {name} must not contain '{ARCHIVE_SEPARATOR}'")
+        data = load_profile(profile, convert=False) if isinstance(profile, str) else profile
+        data = np.asarray(data, dtype=float).ravel()
+        index[name] = {'offset': offset, 'length': len(data)}
+        blocks.append(data)
+        offset += len(data)
+    _save_npy(archive_path, np.concatenate(blocks) if blocks else np.zeros(0))
+    with open(_index_path(archive_path), 'w') as f:
+        json.dump(index, f, indent=1)
+    return archive_path
+
+
+def _index_path(archive_path):
+    return os.path.splitext(archive_path)[0] + '.json'
+
+
+def open_archive(archive_path):
+    """Memory-mapped views of every profile of an archive, as {name: array}."""
+    with open(_index_path(archive_path)) as f:
+        index = json.load(f)
+    data = np.load(archive_path, mmap_mode='r')
+    return {name: data[v['offset']:v['offset'] + v['length']] for name, v in index.items()}
+
+
+def load_profile(path, n_hours=None, convert=True):
+    """Hourly profile as a read-only (memory-mapped when possible) array.
+
+    Parameters
+    ----------
+    path : str
+        Text profile, .npy profile or '<archive>.npy::<name>'.
+    n_hours : int | None
+        Number of leading hours returned (all by default).
+    convert : bool
+        Text profiles are converted once to ``<path>.npy`` and memory-mapped afterwards.
+        The conversion is redone when the text file is newer; if it cannot be written the text is parsed.
+    """
+    if ARCHIVE_SEPARATOR in path:
+        archive_path, name = path.split(ARCHIVE_SEPARATOR, 1)
+        data = open_archive(archive_path)[name]
+    elif path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+    else:
+        npy_path = path + '.npy'
+        fresh = os.path.exists(npy_path) and os.path.getmtime(npy_path) >= os.path.getmtime(path)
+        if not fresh and convert:
+            try:
+                convert_profile(path, npy_path)
+                fresh = True
+            except OSError:
+                pass
+        data = np.load(npy_path, mmap_mode='r') if fresh else np.loadtxt(path, dtype=float).ravel()
+    if n_hours is not None:
+        if len(data) < n_hours:
+            raise ValueError(f"Profile {path} has {len(data)} hours, {n_hours} needed")
+        data = data[:int(n_hours)]
+    return data
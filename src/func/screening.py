@@ -0,0 +1,144 @@
+import numpy as np
+
+try:
+    # Prefer package-relative import if available
+    from .cost_matrix import cost_matrix
+except Exception:
+    # Fallback when executed via %run without package context
+    from cost_matrix import cost_matrix
+
+# Courbes de filtrage (screening curves) : coût annuel d'un MW selon sa durée d'utilisation u (h/an)
+#   cost[t, y, u] = fix[t, y] + var_tot[t, y] * u     [€/MW/an]
+# L'enveloppe inférieure donne la techno la moins chère pour chaque durée d'utilisation (les durées de
+# basculement sont les heures d'équilibre). Croisée avec la monotone de la demande résiduelle
+# (demande - productions fatales exogènes), elle donne un mix de capacités sans solveur :
+# chaque tranche de puissance est servie par la techno la moins chère pour sa durée d'appel.
+HOURS_PER_YEAR = 8760
+
+
+def screening_costs(techno, years, hours=None, keys=None):
+    """Cost tensor of the screening curves.
+
+    Parameters
+    ----------
+    techno : dict[int, Techno]
+        Technologies of the scenario.
+    years : range | list[int]
+        Years kept (must be in years_world).
+    hours : np.ndarray | None
+        Hours of use per year (1..8760 by default).
+    keys : list[int] | None
+        Techno indices kept, in row order (all by default).
+
+    Returns
+    -------
+    (list[int], np.ndarray)
+        Techno indices and costs [n_techno, n_years, n_hours] in €/MW/y.
+    """
+    keys = list(techno.keys()) if keys is None else list(keys)
+    sub = {i: techno[i] for i in keys}
+    _, fix = cost_matrix(sub, 'cost_profile_fix', years)
+    _, var = cost_matrix(sub, 'var_tot', years)
+    hours = np.arange(1, HOURS_PER_YEAR + 1) if hours is None else np.asarray(hours)
+    return keys, fix[:, :, None] + var[:, :, None] * hours
+
+
+def lower_envelope(costs):
+    """Row of the cheapest techno [n_years, n_hours] and the envelope cost [n_years, n_hours]."""
+    best = costs.argmin(axis=0)
+    return best, np.take_along_axis(costs, best[None], axis=0)[0]
+
+
+def breakeven_hours(best, hours=None):
+    """Envelope segments of each year, as a list (per year) of (row, first hour of use where it is cheapest)."""
+    hours = np.arange(1, best.shape[1] + 1) if hours is None else np.asarray(hours)
+    segments = []
+    for b in best:
+        start = np.concatenate(([0], np.flatnonzero(b[1:] != b[:-1]) + 1))
+        segments.append([(int(b[i]), hours[i].item()) for i in start])
+    return segments
+
+
+def residual_duration_curve(demand, week_weights, must_run=()):
+    """Residual demand duration curve of each year.
+
+    Parameters
+    ----------
+    demand : series_ywh
+        Demand [n_years, n_weeks, n_hours] (MW).
+    week_weights : np.ndarray
+        Number of real weeks represented by each representative week.
+    must_run : iterable[series_ywh]
+        Exogenous productions subtracted from the demand (lake, ror, cogen, ...).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        Residual load sorted in decreasing order [n_years, n_weeks*n_hours] (MW) and the
+        number of hours per year the load is at least that level.
+    """
+    residual = np.array(demand.to_numpy(), dtype=float)
+    for E in must_run:
+        residual -= E.to_numpy()
+    n_years, _, n_hours = residual.shape
+    residual = residual.reshape(n_years, -1)
+    duration = np.repeat(np.asarray(week_weights, dtype=float), n_hours)
+    order = np.argsort(-residual, axis=1, kind='stable')
+    return np.take_along_axis(residual, order, axis=1), np.cumsum(duration[order], axis=1)
+
+
+def capacity_mix(best, load, duration, n_rows, hours=None):
+    """Capacity of each envelope row [n_rows, n_years] serving the residual load duration curve (MW)."""
+    hours = np.arange(1, best.shape[1] + 1) if hours is None else np.asarray(hours)
+    load = np.clip(load, 0, None)
+    # Tranche k : entre load[k+1] et load[k], appelée duration[k] heures par an
+    height = load - np.concatenate((load[:, 1:], np.zeros((len(load), 1))), axis=1)
+    use = np.minimum(np.searchsorted(hours, duration), len(hours) - 1)
+    rows = np.take_along_axis(best, use, axis=1)
+    flat = rows + n_rows * np.arange(len(load))[:, None]
+    return np.bincount(flat.ravel(), weights=height.ravel(), minlength=n_rows * len(load)).reshape(len(load), n_rows).T
+
+
+def screening_mix(techno, years, demand, week_weights, keys=None, must_run=None):
+    """Screening-curve capacity estimate, without solver.
+
+    Parameters
+    ----------
+    techno : dict[int, Techno]
+        Technologies of the scenario.
+    years : range
+        Scenario years (axis of demand).
+    demand : series_ywh
+        Demand (MW).
+    week_weights : np.ndarray
+        Number of real weeks represented by each representative week.
+    keys : list[int] | None
+        Candidate technos (dispatchable ones by default).
+    must_run : list[int] | None
+        Technos whose exogenous energy is removed from the demand (fatal technos with a fixed E by default).
+
+    Returns
+    -------
+    dict
+        'keys', 'costs' [n_keys, n_years, 8760], 'best', 'envelope', 'breakeven', 'load', 'duration'
+        and 'capacity' [n_keys, n_years] (MW).
+    """
+    if keys is None:
+        keys = [i for i, t in techno.items() if t.get_type() == 'dispatchable']
+    if must_run is None:
+        must_run = [i for i, t in techno.items()
+                    if t.get_type() == 'fatal' and t.get_tech().get_E() is not None
+                    and t.get_tech().get_isEvar() is not None and not t.get_tech().get_isEvar().any()]
+    keys, costs = screening_costs(techno, years, keys=keys)
+    best, envelope = lower_envelope(costs)
+    load, duration = residual_duration_curve(demand, week_weights, [techno[i].get_tech().get_E() for i in must_run])
+    return {
+        'keys': keys,
+        'costs': costs,
+        'best': best,
+        'envelope': envelope,
+        'breakeven': breakeven_hours(best),
+        'load': load,
+        'duration': duration,
+        'capacity': capacity_mix(best, load, duration, len(keys)),
+    }
@@ -0,0 +1,68 @@
+import numpy as np
+
+# Choix de la semaine réelle utilisée pour chaque semaine représentative (facteurs de charge des templates)
+# group[i] est la semaine représentative (0..number_of_mean_weeks-1) de la période i, comme renvoyé par R_M4_Demand.
+#   - 'random' : une semaine tirée au hasard dans le groupe, tirage différent pour chaque année
+#   - 'high'   : la semaine du groupe de plus forte énergie
+#   - 'low'    : la semaine du groupe de plus faible énergie
+#   - 'medium' : la semaine du groupe dont l'énergie est la plus proche de l'énergie moyenne du groupe
+# En cas d'égalité, la semaine la plus ancienne est retenue (comme idxmax/idxmin).
+SELECTION_MODES = ('random', 'high', 'low', 'medium')
+
+
+def select_weeks(profile, group, number_of_mean_weeks, mode, n_years=1, rng=None):
+    """Index of the period selected in each group.
+
+    Parameters
+    ----------
+    profile : DataFrame | np.ndarray
+        Profiles [n_periods, n_hours] (e.g. pv_lf_reshape).
+    group : np.ndarray
+        Group of each period, values in 0..number_of_mean_weeks-1.
+    mode : str
+        'random', 'high', 'low' or 'medium'.
+    n_years : int
+        Number of independent draws for 'random'.
+    rng : np.random.Generator | None
+        Random generator for 'random'.
+
+    Returns
+    -------
+    np.ndarray
+        Integer array [number_of_mean_weeks], or [n_years, number_of_mean_weeks] for 'random'.
+    """
+    x = np.asarray(profile.to_numpy() if hasattr(profile, 'to_numpy') else profile, dtype=float)
+    group = np.asarray(group)
+    counts = np.bincount(group, minlength=number_of_mean_weeks)
+    if (counts == 0).any():
+        raise ValueError(f"Empty representative week(s): {np.flatnonzero(counts == 0).tolist()}")
+    order = np.argsort(group, kind='stable')
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    if mode == 'random':
+        rng = np.random.default_rng() if rng is None else rng
+        draw = (rng.random((n_years, number_of_mean_weeks)) * counts).astype(int)
+        return order[first + draw]
+
+    # Energie de chaque période, calculée une seule fois
+    energy = x.sum(axis=1)
+    if mode == 'high':
+        key = -energy
+    elif mode == 'low':
+        key = energy
+    elif mode == 'medium':
+        key = np.abs(energy - (np.bincount(group, weights=energy, minlength=number_of_mean_weeks) / counts)[group])
+    else:
+        raise ValueError(f"Invalid selection mode {mode}, choose in [random,high,medium,low]")
+    # Par groupe, meilleure période en premier (la plus ancienne en cas d'égalité)
+    order = np.lexsort((key, group))
+    return order[first]
+
+
+def select_profile(profile, group, number_of_mean_weeks, mode, years, rng=None):
+    """Selected periods of ``profile`` for every year, as an array [n_years, number_of_mean_weeks, n_hours]."""
+    x = np.asarray(profile.to_numpy() if hasattr(profile, 'to_numpy') else profile, dtype=float)
+    index = select_weeks(x, group, number_of_mean_weeks, mode, n_years=len(years), rng=rng)
+    if index.ndim == 1:
+        return np.broadcast_to(x[index], (len(years), number_of_mean_weeks, x.shape[1]))
+    return x[index]
@@ -0,0 +1,140 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Chargement déclaratif des technos
+# Chaque techno est décrite par une spec : {'name': ..., 'script': ..., 'profile': ..., 'requires': [...]}
+#   - script   : template sous inp/template (ex : 'ren/pv.py')
+#   - profile  : chemin du profil horaire lu par le template (remplace sys.argv[1])
+#   - requires : specs dont le template réutilise les variables (ex : cogen lit lake_lf_reshape)
+#   - inputs   : autres fichiers de données lus par le template (pris en compte par l'instantané techno_snapshot)
+# Chaque template est exécuté dans sa propre copie de l'espace de noms du scénario (hypothèses, axes de temps, group,
+# classes), avec un dictionnaire techno vide : les templates indépendants peuvent donc tourner en parallèle.
+# Les technos sont ensuite renumérotées dans l'ordre des specs, comme avec les %run successifs.
+
+# Noms gérés par le loader, jamais exportés
+LOADER_NAMES = ('techno', 'index', 'profile_path', 'rng', '__builtins__')
+
+# Sources exécutées par base_namespace (même ordre que le notebook)
+BASE_SOURCES = (
+    'raw_import.py',
+    'func/dictionary.py',
+    'classes/series/class_series_ywh.py',
+    'classes/series/class_series_profile.py',
+    'classes/series/class_series_mask.py',
+    'classes/series/class_series_year.py',
+    'classes/parameters/generic/class_prm_eco.py',
+    'classes/parameters/generic/class_prm_tech.py',
+    'classes/parameters/specific/class_prm_dispatchable.py',
+    'classes/parameters/specific/class_prm_fatal.py',
+    'classes/parameters/specific/class_prm_storage.py',
+    'classes/class_technos.py',
+    'func/distance_cluster.py',
+    'func/profile_store.py',
+    'func/select_weeks.py',
+    'func/R_M4_Demand.py',
+)
+
+
+def base_namespace(config, src_path='../../src/'):
+    """Namespace for TechnoLoader outside the notebook.
+
+    Runs the class and helper sources, then adds ``config``: the scenario hypotheses (r, occ_pv,
+    loadfactor_pv, ...), the time axes (years, weeks, hours, years_world, start_world, ...) and
+    the representative-week ``group`` array.
+    """
+    ns = {'__name__': '__techno_loader__'}
+    for source in BASE_SOURCES:
+        path = os.path.join(src_path, source)
+        # Comme %run : le dossier du script est importable pendant son exécution (imports entre modules de func)
+        folder = os.path.abspath(os.path.dirname(path))
+        sys.path.insert(0, folder)
+        try:
+            with open(path) as f:
+                exec(compile(f.read(), path, 'exec'), ns)
+        finally:
+            sys.path.remove(folder)
+    ns.update(config)
+    return ns
+
+
+class TechnoLoader:
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, specs, namespace, template_dir='.', max_workers=None, seed=None):
+
+        self._specs        = [dict(spec) for spec in specs]   # Techno specs, in numbering order
+        self._namespace    = namespace                        # Scenario namespace (notebook globals or base_namespace)
+        self._template_dir = template_dir                     # Directory of the template scripts
+        self._max_workers  = max_workers                      # Thread pool size (1 -> serial)
+        self._seed         = namespace.get('RNG_SEED') if seed is None else seed
+        self._namespaces   = {}                               # Namespace of each spec after its template ran
+        self._check_specs()
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def _check_specs(self):
+        seen = set()
+        for spec in self._specs:
+            name = spec['name']
+            if name in seen:
+                raise ValueError(f"Duplicate techno spec {name}")
+            for req in spec.get('requires', ()):
+                # Une dépendance doit précéder : elle est soumise au pool avant la spec qui l'attend
+                if req not in seen:
+                    raise ValueError(f"Techno spec {name} requires {req}, which must be declared before it")
+            seen.add(name)
+
+    def _run(self, spec, rng, futures):
+        ns = dict(self._namespace)
+        for req in spec.get('requires', ()):
+            futures[req].result()
+            ns.update(self._exports(self._namespaces[req]))
+        ns['techno'] = {}
+        ns['index'] = 1
+        ns['profile_path'] = spec.get('profile')
+        ns['rng'] = rng
+        path = os.path.join(self._template_dir, spec['script'])
+        with open(path) as f:
+            exec(compile(f.read(), path, 'exec'), ns)
+        self._namespaces[spec['name']] = ns
+        return ns
+
+    def _exports(self, ns):
+        # Variables créées ou remplacées par le template
+        return {k: v for k, v in ns.items()
+                if k not in LOADER_NAMES and (k not in self._namespace or self._namespace[k] is not v)}
+
+    def load(self):
+        """Run every template and return the technos as {index: Techno}, numbered in spec order."""
+        self._namespaces = {}
+        rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(self._seed).spawn(len(self._specs))]
+        futures = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for spec, rng in zip(self._specs, rngs):
+                futures[spec['name']] = executor.submit(self._run, spec, rng, futures)
+            for future in futures.values():
+                future.result()
+
+        techno = {}
+        index = 1
+        for spec in self._specs:
+            for t in self._namespaces[spec['name']]['techno'].values():
+                techno[index] = t
+                index = index + 1
+        return techno
+
+# --------------------- GET methods -----------------------------------------------------------------------------------
+
+    def get_specs(self):
+        return self._specs
+    def get_namespaces(self):
+        """Namespace of each spec after load(), keyed by spec name."""
+        return self._namespaces
+    def exports(self):
+        """Variables defined by the templates (dict_pv_lf, won_lf_reshape, ...); later specs override earlier ones, as with %run -i."""
+        out = {}
+        for spec in self._specs:
+            out.update(self._exports(self._namespaces[spec['name']]))
+        return out
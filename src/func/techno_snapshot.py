@@ -0,0 +1,112 @@
+import glob
+import hashlib
+import os
+import pickle
+
+import numpy as np
+
+# Instantané disque d'un jeu de technos entièrement construit
+# Le fichier contient le dictionnaire techno, les axes de temps (years, weeks, hours, weight_week_dict, group, ...)
+# et des variables annexes (demand_dict, variables des templates pour les graphes d'entrée).
+# Il est repéré par un hash des paramètres du scénario, du contenu des fichiers d'entrée et des sources
+# (classes, fonctions, templates) : toute modification de l'un d'eux donne une autre clé, donc une reconstruction.
+SNAPSHOT_VERSION = 1  # A incrémenter si le format de l'instantané change
+
+
+def _canonical(value):
+    # Représentation stable d'un paramètre de scénario (les dicts sont triés, les tableaux hachés)
+    if isinstance(value, dict):
+        return '{' + ','.join(f"{_canonical(k)}:{_canonical(v)}" for k, v in sorted(value.items(), key=lambda kv: repr(kv[0]))) + '}'
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + '(' + ','.join(_canonical(v) for v in value) + ')'
+    if isinstance(value, np.ndarray):
+        return f"array({value.dtype},{value.shape},{hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()})"
+    return repr(value)
+
+
+def is_config_value(value):
+    """True for values that can be part of the scenario key (numbers, strings, ranges, arrays and containers of these)."""
+    if value is None or isinstance(value, (bool, int, float, str, range, np.generic, np.ndarray)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(is_config_value(v) for v in value)
+    if isinstance(value, dict):
+        return all(is_config_value(k) and is_config_value(v) for k, v in value.items())
+    return False
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def snapshot_key(config, files=(), sources=()):
+    """Hash of the scenario parameters, the input files and the source files.
+
+    Parameters
+    ----------
+    config : dict
+        Scenario parameters (values accepted by is_config_value).
+    files : iterable[str]
+        Input data files (demand, load factor profiles, ...). Archive paths '<archive>.npy::<name>' hash the archive.
+    sources : iterable[str]
+        Python sources the build depends on (classes, functions, templates).
+    """
+    invalid = [k for k, v in config.items() if not is_config_value(v)]
+    if invalid:
+        raise TypeError(f"Scenario parameters not usable in the snapshot key: {invalid}")
+    h = hashlib.sha256()
+    h.update(f"{SNAPSHOT_VERSION}|{_canonical(config)}".encode())
+    for path in list(files) + list(sources):
+        path = path.split('::', 1)[0]
+        h.update(f"|{os.path.basename(path)}:{_file_digest(path)}".encode())
+    return h.hexdigest()
+
+
+def snapshot_path(snapshot_dir, key):
+    return os.path.join(snapshot_dir, f"techno_{key}.pkl")
+
+
+def save_snapshot(path, techno, axes, extra=None, keep=1):
+    """Write the technos, the time axes and optional extra variables (atomic write).
+
+    Only the ``keep`` most recent snapshots of the directory (this one included) are kept.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump({'version': SNAPSHOT_VERSION, 'techno': techno, 'axes': axes, 'extra': extra or {}},
+                    f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    _prune_snapshots(os.path.dirname(path) or '.', path, keep)
+    return path
+
+
+def _prune_snapshots(snapshot_dir, current, keep):
+    # Supprime les instantanés les plus anciens (clés périmées) : seuls les `keep` plus récents restent
+    others = [p for p in glob.glob(os.path.join(snapshot_dir, 'techno_*.pkl')) if os.path.abspath(p) != os.path.abspath(current)]
+    others.sort(key=os.path.getmtime, reverse=True)
+    for stale in others[max(keep - 1, 0):]:
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+
+
+def load_snapshot(path):
+    """Snapshot {'techno', 'axes', 'extra'} stored at path, None if missing, unreadable or of another version."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+        print(f"Snapshot {path} ignored ({type(e).__name__}: {e})")
+        return None
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        print(f"Snapshot {path} ignored (version {snapshot.get('version')}, expected {SNAPSHOT_VERSION})")
+        return None
+    return snapshot
@@ -0,0 +1,17 @@
+"""Capacity-expansion and dispatch model built from the Techno objects.
+
+ModelData extracts the techno parameters as arrays, LinearProgram assembles the LP as sparse
+constraint blocks, DocplexBuilder turns it into a docplex model, HighsSolver solves it with
+HiGHS (scipy) and store_solution writes a solution back into the technos. ParametricModel keeps
+a built model and updates its costs and right-hand sides in place for scenario sweeps;
+PresolvedProgram removes the fixed and structurally zero columns before building and
+RollingHorizon solves the horizon myopically, window by window.
+"""
+from .data import ModelData, TechnoData
+from .lp import LinearProgram, ConstraintBlock, VAR_FAMILIES
+from .docplex_builder import DocplexBuilder
+from .highs_backend import HighsSolver
+from .parametric import ParametricModel
+from .presolve import PresolvedProgram
+from .rolling import RollingHorizon
+from .solution import store_solution, store_values
@@ -0,0 +1,170 @@
+import copy
+
+import numpy as np
+
+# Données du modèle extraites des objets Techno, sous forme de tableaux NumPy alignés sur (years, weeks, hours)
+# Seuls les getters des classes prm_* sont utilisés : le paquet ne dépend pas des scripts du notebook.
+
+
+def _year_values(series, years, default=0.0):
+    # Valeurs d'une série annuelle (dict ou series_year) sur years, default si la série est absente
+    if series is None:
+        return np.full(len(years), default, dtype=float)
+    return np.array([series[y] for y in years], dtype=float)
+
+
+def _ywh_values(series, shape, default=0.0):
+    if series is None:
+        return np.full(shape, default, dtype=float)
+    return np.asarray(series.to_numpy(), dtype=float).reshape(shape)
+
+
+class TechnoData:
+    """Arrays of one techno used by the model builders (capacity, energy, costs, storage)."""
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, index, t, years, weeks, hours):
+
+        self.index = index             # Key of the techno in the techno dict
+        self.type  = t.get_type()      # 'dispatchable', 'fatal' or 'storage'
+        self.name  = t.get_name()
+        self.title = t.get_title()
+        self.years, self.weeks, self.hours = years, weeks, hours
+
+        self.ramp_from = None          # Rolling horizon: energy of the hour before the first one (ramping)
+
+        self.set_capacity(t)
+        self.set_costs(t)
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def set_capacity(self, t):
+        """(Re)read capacity, energy, availability, ramping and storage parameters of Techno t."""
+        tec, eco, spec = t.get_tech(), t.get_eco(), t.get_spec()
+        years, weeks = self.years, self.weeks
+        ny, shape = len(years), (len(years), len(weeks), len(self.hours))
+
+        # Capacity
+        self.P_is_var = tec.get_isPvar().to_numpy().reshape(ny)          # [ny] capacity endogenous
+        P = tec.get_P()
+        self.P_fixed  = np.array([P[y] if not v else 0.0 for y, v in zip(years, self.P_is_var)], dtype=float)
+        inv_max = tec.get_InvMax()                                       # Keyed by y-1
+        self.inv_max  = None if inv_max is None else np.array([inv_max[y - 1] for y in years], dtype=float)
+        self.lt       = eco.get_lt()
+        self.hist_inv  = dict(tec.get_historic_data('INV') or {})
+        self.hist_capa = dict(tec.get_historic_data('CAPA') or {})
+        self.hist_dec  = dict(tec.get_historic_data('DEC') or {})
+
+        # Energy
+        self.E_is_var = tec.get_isEvar().to_numpy().reshape(shape)       # [ny, nw, nh] energy endogenous
+        self.E_fixed  = np.where(self.E_is_var, 0.0, _ywh_values(tec.get_E(), shape)) if not self.E_is_var.all() else None
+        self.LF       = _ywh_values(tec.get_LF(), shape) if self.type == 'fatal' else None
+        A = tec.get_A()                                                  # Availability A[y, w]
+        if A is None:
+            self.A = np.ones((len(years), len(weeks)))
+        elif hasattr(A, 'to_numpy'):
+            self.A = np.asarray(A.to_numpy(), dtype=float).reshape(len(years), len(weeks))
+        else:
+            self.A = np.array([[A[y, w] for w in weeks] for y in years], dtype=float)
+
+        # Ramping (dispatchable and storage specs), as a fraction of P per hour
+        self.ramp = None
+        if self.type != 'fatal' and hasattr(spec, 'get_rup'):
+            self.ramp = (spec.get_rup(), spec.get_rdo())
+
+        # Storage (the charge techno carries the parameters of the pair)
+        self.storage = None
+        if self.type == 'storage' and self.title == 'charge':
+            self.storage = {
+                'eff_charge':     spec.get_efficiency_charge(),
+                'eff_discharge':  spec.get_efficiency_discharge(),
+                'level_max_time': spec.get_level_max_time(),
+                'level_min':      spec.get_level_min(),
+                'level_start':    spec.get_level_start(),
+                'is_P_sym':       spec.get_is_P_sym(),
+            }
+
+    def window(self, years, iy):
+        """Copy restricted to the years of slice iy (rolling horizon)."""
+        td = copy.copy(self)
+        td.years = years
+        for name in ('P_is_var', 'P_fixed', 'inv_max', 'E_is_var', 'E_fixed', 'LF', 'A', 'fix_dep', 'fix_om_mi', 'var_tot'):
+            value = getattr(self, name)
+            if value is not None:
+                setattr(td, name, value[iy])
+        td.hist_inv, td.hist_capa, td.hist_dec = dict(self.hist_inv), dict(self.hist_capa), dict(self.hist_dec)
+        td.storage = None if self.storage is None else dict(self.storage)
+        return td
+
+    def set_costs(self, t):
+        """(Re)read the cost parameters of Techno t (capex annuities or depreciation, O&M, variable costs)."""
+        eco, years = t.get_eco(), self.years
+        self.is_cap    = eco.is_cap()
+        self.fix_cap   = eco.get_fix_cap() if self.is_cap else None   # series over years_world
+        self.fix_dep   = _year_values(eco.get_fix_dep(), years) if not self.is_cap else None
+        self.fix_om_mi = _year_values(eco.get_fix_om(), years) + _year_values(eco.get_fix_mi(), years)
+        self.var_tot   = _year_values(eco.get_var_tot(), years)
+        self.deco_cost = eco.get_deco_cost() or 0
+
+
+class ModelData:
+    """Capacity-expansion and dispatch data of a scenario, extracted once from the techno dict.
+
+    Parameters
+    ----------
+    techno : dict[int, Techno]
+        Technologies of the scenario (a storage charge techno is followed by its discharge techno).
+    demand : series_ywh
+        Demand [n_years, n_weeks, n_hours] (MW).
+    years, weeks, hours : range
+        Scenario axes; the first year is the start of the scenario.
+    week_weights : np.ndarray
+        Number of real weeks represented by each representative week.
+    r : float
+        Discount rate of the objective.
+    deploy_start : dict[str, int] | None
+        First year a techno title may have capacity (e.g. {'new': nuke_new_start}).
+    ramping : bool
+        Add ramping constraints for the technos with a ramp.
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, techno, demand, years, weeks, hours, week_weights, r, deploy_start=None, ramping=True):
+
+        self.years   = years
+        self.weeks   = weeks
+        self.hours   = hours
+        self.shape   = (len(years), len(weeks), len(hours))
+        self.demand  = np.asarray(demand.to_numpy(), dtype=float).reshape(self.shape)
+        self.weights = np.asarray(week_weights, dtype=float)
+        self.r       = r
+        self.ramping = ramping
+        self.deploy_start = dict(deploy_start or {})
+        self.start_of_scenario = years.start
+        self.inv_years = range(years.start - 1, years.stop - 1)   # Inv/Dec are indexed by y-1
+        self.max_P   = self.demand.max()                          # Upper bound of capacity/production variables
+        self.lev     = 1 / (1 + r) ** (np.arange(len(years)))     # Discount factor of each year
+
+        self.keys    = list(techno.keys())
+        self.technos = [TechnoData(i, techno[i], years, weeks, hours) for i in self.keys]
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def position(self, i):
+        """Row of techno i in the model arrays."""
+        return self.keys.index(i)
+
+    def window(self, years):
+        """Copy restricted to a sub-range of the years (rolling horizon).
+
+        Bounds (max_P) are those of the full horizon; the history before the window (hist_capa,
+        hist_inv, hist_dec, storage carry) is left to the caller.
+        """
+        iy = slice(years.start - self.years.start, years.stop - self.years.start)
+        d = copy.copy(self)
+        d.years   = years
+        d.shape   = (len(years),) + self.shape[1:]
+        d.demand  = self.demand[iy]
+        d.start_of_scenario = years.start
+        d.inv_years = range(years.start - 1, years.stop - 1)
+        d.lev     = 1 / (1 + self.r) ** (np.arange(len(years)))
+        d.technos = [td.window(years, iy) for td in self.technos]
+        return d
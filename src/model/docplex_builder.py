@@ -0,0 +1,137 @@
+import gc
+import time
+
+import numpy as np
+from docplex.mp.advmodel import AdvModel
+
+from .lp import VAR_FAMILIES
+
+
+class DocplexBuilder:
+    """Build a docplex model from a LinearProgram with batch calls.
+
+    Variables of each family are created by one ``continuous_var_list`` call (named like the
+    notebook: var_P_<i>_<y>, var_E_<i>_<y>_<w>_<h>, ...), each constraint block is added with
+    ``matrix_constraints`` + ``add_constraints`` and the objective is one ``scal_prod``.
+    Build time is recorded per constraint family in ``timings``.
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, lp, name='model', model=None):
+
+        self._lp      = lp
+        self._model   = model if model is not None else AdvModel(name=name)
+        self._vars    = None   # Variables in column order (np.ndarray of Var)
+        self._var     = {}     # Notebook-style dicts {'P': {(i,y): Var}, 'E': {(i,y,w,h): Var}, ...}
+        self._cts     = []     # Constraints of each block, in lp.blocks order
+        self.timings  = {}     # Family -> [number of constraints, seconds]
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def build(self, verbose=True):
+        """Create variables, constraints and objective; return the docplex model."""
+        self.add_variables()
+        self.add_constraints()
+        self.add_objective()
+        if verbose:
+            self.print_timings()
+        return self._model
+
+    def _batch(self, step):
+        # Le ramasse-miettes parcourt sans cesse les millions d'objets docplex créés : suspendu pendant la construction
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            step()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def add_variables(self):
+        """One continuous_var_list per variable family."""
+        self._batch(self._add_variables)
+        return self._model
+
+    def add_constraints(self):
+        """One matrix_constraints/add_constraints call per constraint block."""
+        self._batch(self._add_constraints)
+        return self._model
+
+    def add_objective(self):
+        start = time.perf_counter()
+        self.set_objective(self._lp.c, self._lp.c0)
+        self.timings['objective'] = [int(np.count_nonzero(self._lp.c)), time.perf_counter() - start]
+        return self._model
+
+    def _add_variables(self):
+        lp, mdl = self._lp, self._model
+        self._vars = np.empty(lp.n_vars, dtype=object)
+        start = time.perf_counter()
+        for fam in VAR_FAMILIES:
+            cols = lp.columns[fam].ravel()
+            keys = lp.var_keys(fam)
+            if (cols < 0).any():   # Columns removed by the presolve
+                keys = [key for key, col in zip(keys, cols.tolist()) if col >= 0]
+                cols = cols[cols >= 0]
+            ub = [None if np.isinf(u) else u for u in lp.ub[cols].tolist()]
+            variables = mdl.continuous_var_list(keys, lb=lp.lb[cols].tolist(), ub=ub, name=f'var_{fam}')
+            self._vars[cols] = variables
+            self._var[fam] = dict(zip(keys, variables))
+        self.timings['variables'] = [lp.n_vars, time.perf_counter() - start]
+
+    def _add_constraints(self):
+        lp, mdl = self._lp, self._model
+        for block in lp.blocks:
+            start = time.perf_counter()
+            # Sous-matrice restreinte aux colonnes utilisées par le bloc
+            used = np.unique(block.A.indices)
+            A = block.A[:, used]
+            cts = mdl.matrix_constraints(A, self._vars[used].tolist(), block.rhs.tolist(), block.sense)
+            self._cts.append(mdl.add_constraints(cts))
+            timing = self.timings.setdefault(block.family, [0, 0.0])
+            timing[0] += len(block)
+            timing[1] += time.perf_counter() - start
+
+    def set_objective(self, c, c0=0.0):
+        """Minimise c x + c0."""
+        nz = np.flatnonzero(c)
+        self._model.minimize(self._model.scal_prod(self._vars[nz].tolist(), c[nz].tolist()) + c0)
+
+    def update_objective(self, cols):
+        """Push the lp objective coefficients of columns cols and the constant to the model."""
+        obj = self._model.objective_expr
+        obj.set_coefficients(zip(self._vars[cols].tolist(), self._lp.c[cols].tolist()))
+        obj.constant = self._lp.c0
+
+    def update_rhs(self, changed):
+        """Push the changed right-hand sides {block number: rows} of the lp to the constraints."""
+        for n, rows in changed.items():
+            cts, rhs = self._cts[n], self._lp.blocks[n].rhs
+            for row in rows.tolist():
+                cts[row].rhs = rhs[row]
+
+    def print_timings(self):
+        print('-' * 50)
+        print(f"{'Family':<20}{'Rows':>10}{'Time (s)':>12}")
+        for fam, (n, t) in self.timings.items():
+            print(f"{fam:<20}{n:>10}{t:>12.3f}")
+        print(f"{'Total':<20}{self._model.number_of_constraints:>10}{sum(t for _, t in self.timings.values()):>12.3f}")
+        print('-' * 50)
+
+    def solution_values(self, solution=None):
+        """Values of all variables in column order, as an array."""
+        solution = solution if solution is not None else self._model.solution
+        return np.array(solution.get_values(self._vars.tolist()), dtype=float)
+
+# --------------------- GET methods -----------------------------------------------------------------------------------
+
+    def get_model(self):
+        return self._model
+    def get_vars(self):
+        """Variables in column order (np.ndarray of docplex Var)."""
+        return self._vars
+    def get_var(self, family):
+        """Notebook-style dict of a variable family ('P', 'Inv', 'Dec', 'E', 'EC', 'SE')."""
+        return self._var[family]
+    def get_constraints(self):
+        """Constraints of each block of lp.blocks (list of lists)."""
+        return self._cts
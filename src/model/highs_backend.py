@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+
+class HighsSolver:
+    """Solve a LinearProgram with HiGHS through ``scipy.optimize.linprog`` (no CPLEX licence needed).
+
+    The constraint blocks are stacked once into sparse ``A_ub``/``A_eq`` matrices; the solution
+    vector is in lp column order and can be written back with ``store_solution``.
+
+    Parameters
+    ----------
+    lp : LinearProgram
+        Program to solve.
+    method : str
+        'highs' (automatic choice), 'highs-ds' (dual simplex) or 'highs-ipm' (interior point).
+    **options
+        HiGHS options passed to linprog (time_limit, presolve, disp, primal_feasibility_tolerance, ...).
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, lp, method='highs', **options):
+
+        self._lp      = lp
+        self._method  = method
+        self._options = options
+        self._result  = None   # scipy OptimizeResult of the last solve
+        self.solve_time = None
+
+        self.A_ub, self.b_ub, self.A_eq, self.b_eq = lp.to_sparse()
+        self.bounds = np.column_stack((lp.lb, lp.ub))
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def solve(self, log_output=False):
+        """Solve the program; return the OptimizeResult, or None if no optimal solution was found."""
+        options = {'disp': log_output, **self._options}
+        start = time.perf_counter()
+        self._result = linprog(self._lp.c, A_ub=self.A_ub, b_ub=self.b_ub, A_eq=self.A_eq, b_eq=self.b_eq,
+                               bounds=self.bounds, method=self._method, options=options)
+        self.solve_time = time.perf_counter() - start
+        return self._result if self._result.status == 0 else None
+
+    def update_rhs(self):
+        """Re-read the right-hand sides of the lp (after LinearProgram.update_constraints)."""
+        self.b_ub, self.b_eq = self._lp.rhs_vectors()
+
+    def solution_values(self):
+        """Values of all variables in column order, as an array."""
+        if self._result is None or self._result.x is None:
+            raise RuntimeError('No solution available: run solve() first')
+        return self._result.x
+
+# --------------------- GET methods -----------------------------------------------------------------------------------
+
+    def get_status(self):
+        return None if self._result is None else self._result.message
+    def get_objective_value(self):
+        """Objective value c x + c0 of the last solution."""
+        return self._result.fun + self._lp.c0
+    def get_result(self):
+        return self._result
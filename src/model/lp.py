@@ -0,0 +1,295 @@
+from itertools import product
+
+import numpy as np
+import scipy.sparse as sp
+
+# Programme linéaire capacité + dispatch, indépendant du solveur
+# Variables (même nommage que le notebook) :
+#   P[i,y], Inv[i,y-1], Dec[i,y-1]               capacité, investissement, déclassement
+#   E[i,y,w,h], EC[i,y,w,h], SE[i,y,w,h]         production, écrêtement, niveau de stockage
+# Les contraintes sont rangées par famille ('demand', 'availability', 'ramping', ...). Chaque bloc est une matrice
+# creuse construite d'un coup à partir des tableaux de ModelData : aucune boucle Python par (y,w,h).
+VAR_FAMILIES   = ('P', 'Inv', 'Dec', 'E', 'EC', 'SE')
+HOURS_PER_YEAR = 8760
+
+
+class ConstraintBlock:
+    """Rows ``A x <sense> rhs`` of one constraint family ('le', 'ge' or 'eq')."""
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, family, sense, A, rhs, techno=None):
+
+        self.family = family   # Constraint family name
+        self.sense  = sense    # 'le', 'ge' or 'eq'
+        self.A      = A        # Coefficients (scipy CSR, one row per constraint)
+        self.rhs    = rhs      # Right-hand side [n_rows]
+        self.techno = techno   # Techno index, None for system-wide rows
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def __len__(self):
+        return self.A.shape[0]
+
+
+class LinearProgram:
+    """Capacity-expansion and dispatch LP ``min c x + c0`` assembled from a ModelData.
+
+    Columns are grouped by variable family; ``columns[family]`` holds the column of every
+    variable, shaped [n_techno, n_years] for P/Inv/Dec and [n_techno, n_years, n_weeks, n_hours]
+    for E/EC/SE. Constraints are kept as ConstraintBlock objects, in family order.
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, data):
+
+        self.data = data
+        nt = len(data.keys)
+        ny, nw, nh = data.shape
+
+        # Column layout
+        sizes = {'P': nt * ny, 'Inv': nt * ny, 'Dec': nt * ny, 'E': nt * ny * nw * nh, 'EC': nt * ny * nw * nh, 'SE': nt * ny * nw * nh}
+        self.columns, offset = {}, 0
+        for fam in VAR_FAMILIES:
+            shape = (nt, ny) if fam in ('P', 'Inv', 'Dec') else (nt, ny, nw, nh)
+            self.columns[fam] = np.arange(offset, offset + sizes[fam]).reshape(shape)
+            offset += sizes[fam]
+        self.n_vars = offset
+
+        # Bounds
+        self.lb = np.zeros(self.n_vars)
+        self.ub = np.full(self.n_vars, data.max_P)
+        self.lb[self.columns['E'].ravel()] = -data.max_P
+        self.ub[self.columns['EC'].ravel()] = np.inf
+        self.ub[self.columns['SE'].ravel()] = data.max_P * HOURS_PER_YEAR
+
+        self.blocks = []
+        self._build_constraints()
+        self.c, self.c0 = self.objective()
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def var_keys(self, family):
+        """Keys of the variables of a family, in column order (as in the notebook dicts var_P, var_E, ...)."""
+        d = self.data
+        if family == 'P':
+            return list(product(d.keys, d.years))
+        if family in ('Inv', 'Dec'):
+            return list(product(d.keys, d.inv_years))
+        return list(product(d.keys, d.years, d.weeks, d.hours))
+
+    def _add(self, family, sense, terms, rhs, techno=None):
+        # terms : liste de (colonnes [m], coefficients [m] ou scalaire), une ligne par élément
+        rhs = np.asarray(rhs, dtype=float).ravel()
+        m = len(rhs)
+        if m == 0:
+            return
+        rows = np.tile(np.arange(m), len(terms))
+        cols = np.concatenate([np.broadcast_to(np.asarray(c).ravel(), (m,)) for c, _ in terms])
+        vals = np.concatenate([np.broadcast_to(np.asarray(v, dtype=float).ravel(), (m,)) for _, v in terms])
+        A = sp.csr_matrix((vals, (rows, cols)), shape=(m, self.n_vars))
+        A.eliminate_zeros()
+        self.blocks.append(ConstraintBlock(family, sense, A, rhs, techno))
+
+    def _build_constraints(self):
+        d = self.data
+        ny, nw, nh = d.shape
+        P, Inv, Dec = self.columns['P'], self.columns['Inv'], self.columns['Dec']
+        E, EC, SE = self.columns['E'], self.columns['EC'], self.columns['SE']
+        year_of = np.repeat(np.arange(ny), nw * nh)        # Year position of each flattened (y,w,h)
+        P_hour = lambda k: np.broadcast_to(P[k][:, None, None], d.shape)
+
+        # Demand balance : sum_i E[i,y,w,h] == demand[y,w,h]
+        self._add('demand', 'eq', [(E[k], 1.0) for k in range(len(d.keys))], d.demand)
+
+        for k, td in enumerate(d.technos):
+            i = td.index
+            is_storage = td.type == 'storage'
+
+            # Positive generation and no storage level for non-storage technos
+            if not is_storage:
+                self._add('positivity', 'ge', [(E[k], 1.0)], np.zeros(d.shape), i)
+                self._add('no_storage_level', 'eq', [(SE[k], 1.0)], np.zeros(d.shape), i)
+
+            # Deployment thresholds (e.g. new nuclear or bioCH4 CCGT)
+            if td.title in d.deploy_start:
+                iy = np.flatnonzero(np.array(d.years) < d.deploy_start[td.title])
+                self._add('deployment', 'eq', [(P[k, iy], 1.0)], np.zeros(len(iy)), i)
+
+            # Investment / decommission / capacity linking
+            var = np.flatnonzero(td.P_is_var)
+            fixed = np.flatnonzero(~td.P_is_var)
+            if len(var):
+                if td.inv_max is not None:
+                    self._add('inv_max', 'le', [(Inv[k, var], 1.0)], td.inv_max[var], i)
+                y_var = np.array(d.years)[var]
+                hist = y_var - td.lt <= d.years.start - 1     # Decommissioning of a vintage built before the scenario
+                self._add('decommissioning', 'eq', [(Dec[k, var[hist]], 1.0)],
+                          [td.hist_inv.get(y - 1 - td.lt, 0) for y in y_var[hist]], i)
+                self._add('decommissioning', 'eq', [(Dec[k, var[~hist]], 1.0), (Inv[k, var[~hist] - td.lt], -1.0)],
+                          np.zeros((~hist).sum()), i)
+                first = var == 0
+                self._add('capacity', 'eq', [(P[k, var[first]], 1.0), (Inv[k, var[first]], -1.0), (Dec[k, var[first]], 1.0)],
+                          [td.hist_capa.get(d.years.start - 1, 0)] * first.sum(), i)
+                nxt = var[~first]
+                self._add('capacity', 'eq', [(P[k, nxt], 1.0), (P[k, nxt - 1], -1.0), (Inv[k, nxt], -1.0), (Dec[k, nxt], 1.0)],
+                          np.zeros(len(nxt)), i)
+            if len(fixed):
+                self._add('fixed_capacity', 'eq', [(Inv[k, fixed], 1.0)], np.zeros(len(fixed)), i)
+                self._add('fixed_capacity', 'eq', [(Dec[k, fixed], 1.0)], np.zeros(len(fixed)), i)
+                self._add('fixed_capacity', 'eq', [(P[k, fixed], 1.0)], td.P_fixed[fixed], i)
+
+            # Availability envelope E <= A * P and exogenous energy E == E_fixed
+            A = np.broadcast_to(td.A[:, :, None], d.shape)
+            self._add('availability', 'le', [(E[k], 1.0), (P_hour(k), -A)], np.zeros(d.shape), i)
+            if td.E_fixed is not None:
+                exo = ~td.E_is_var
+                self._add('exogenous_energy', 'eq', [(E[k][exo], 1.0)], td.E_fixed[exo], i)
+
+            # Fatal generation = load factor * capacity - curtailment
+            if td.type == 'fatal':
+                self._add('fatal', 'eq', [(E[k], 1.0), (P_hour(k), -td.LF), (EC[k], 1.0)], np.zeros(d.shape), i)
+
+            # Ramping between consecutive hours (across weeks and years), P of the later hour
+            if d.ramping and td.ramp is not None:
+                rup, rdo = td.ramp
+                f = np.flatnonzero(td.E_is_var.ravel()[:-1])
+                e = E[k].ravel()
+                p = P[k][year_of[f + 1]]
+                self._add('ramping', 'le', [(e[f + 1], 1.0), (e[f], -1.0), (p, -rup)], np.zeros(len(f)), i)
+                self._add('ramping', 'ge', [(e[f + 1], 1.0), (e[f], -1.0), (p, rdo)], np.zeros(len(f)), i)
+                if td.ramp_from is not None:   # Rolling horizon : from the last hour of the previous window
+                    self._add('ramping', 'le', [(e[0], 1.0), (P[k, 0], -rup)], [td.ramp_from], i)
+                    self._add('ramping', 'ge', [(e[0], 1.0), (P[k, 0], rdo)], [td.ramp_from], i)
+
+            # Storage pair : the charge techno is followed by its discharge techno
+            if td.storage is not None:
+                self._add_storage(k, k + 1, td.storage, i)
+
+    def _add_storage(self, kc, kd, s, i):
+        d = self.data
+        ny, nw, nh = d.shape
+        P, E, SE = self.columns['P'], self.columns['E'], self.columns['SE']
+        Pc = np.broadcast_to(P[kc][:, None, None], d.shape)
+        Pd = np.broadcast_to(P[kd][:, None, None], d.shape)
+        zeros = np.zeros(d.shape)
+
+        if s['is_P_sym']:
+            self._add('storage_sym', 'eq', [(P[kd], 1.0), (P[kc], -1.0)], np.zeros(ny), i)
+        self._add('storage_bounds', 'le', [(E[kd], 1.0), (Pd, -1.0)], zeros, i)
+        self._add('storage_bounds', 'ge', [(E[kd], 1.0)], zeros, i)
+        self._add('storage_bounds', 'le', [(E[kc], 1.0)], zeros, i)
+        self._add('storage_bounds', 'le', [(E[kc], -1.0), (Pc, -1.0)], zeros, i)
+        self._add('storage_bounds', 'eq', [(SE[kc], 1.0), (SE[kd], -1.0)], zeros, i)
+
+        # Level dynamics :
+        #   first hour of the scenario          SE = level_start (rolling horizon : continues the previous window)
+        #   inside a week                       SE[h] = -eff_c E_c - E_d / eff_d + SE[h-1]
+        #   first hour of a week                SE = -eff_c E_c - E_d / eff_d + (SE_end - SE_start)(previous week) * weight + SE_start
+        se, ec, ed = SE[kc].reshape(ny * nw, nh), E[kc].reshape(ny * nw, nh), E[kd].reshape(ny * nw, nh)
+        eff_c, inv_eff_d = s['eff_charge'], 1 / s['eff_discharge']
+        if s.get('carry') is None:
+            self._add('storage_level', 'eq', [(se[0, 0], 1.0)], [s['level_start']], i)
+        else:   # Rolling horizon : continues the last week (end level, start level, weight) of the previous window
+            end, start, weight = s['carry']
+            self._add('storage_level', 'eq', [(se[0, 0], 1.0), (ec[0, 0], eff_c), (ed[0, 0], inv_eff_d)],
+                      [(end - start) * weight + start], i)
+        self._add('storage_level', 'eq', [(se[:, 1:], 1.0), (ec[:, 1:], eff_c), (ed[:, 1:], inv_eff_d), (se[:, :-1], -1.0)],
+                  np.zeros((ny * nw, nh - 1)), i)
+        wgt = np.tile(d.weights, ny)[:-1]                   # Weight of the previous week
+        self._add('storage_level', 'eq', [(se[1:, 0], 1.0), (ec[1:, 0], eff_c), (ed[1:, 0], inv_eff_d),
+                                          (se[:-1, -1], -wgt), (se[:-1, 0], -(-wgt + 1))],
+                  np.zeros(ny * nw - 1), i)
+
+        self._add('storage_capacity', 'le', [(SE[kc], 1.0), (Pc, -s['level_max_time'])], zeros, i)
+        self._add('storage_capacity', 'ge', [(SE[kc], 1.0)], np.full(d.shape, s['level_min']), i)
+        if s.get('terminal'):   # Rolling horizon : the level carried to the next window stays within the bounds
+            carried = [(se[-1, -1], d.weights[-1]), (se[-1, 0], 1 - d.weights[-1])]
+            self._add('storage_capacity', 'ge', carried, [s['level_min']], i)
+            self._add('storage_capacity', 'le', carried + [(P[kc, -1], -s['level_max_time'])], [0.0], i)
+
+    def objective(self):
+        """Objective coefficients c [n_vars] and constant c0 (discounted fixed, variable and residual-value terms)."""
+        d = self.data
+        ny = len(d.years)
+        P, Inv, Dec, E = self.columns['P'], self.columns['Inv'], self.columns['Dec'], self.columns['E']
+        c, c0 = np.zeros(self.n_vars), 0.0
+
+        for k, td in enumerate(d.technos):
+            # Variable costs, weighted by the number of weeks represented
+            c[E[k]] = ((td.var_tot[:, None] * d.weights[None, :]) * d.lev[:, None])[:, :, None]
+
+            # Fixed costs : annuity (CAPEX of the vintages still paid) or depreciation, O&M, decommissioning
+            for iy, y in enumerate(d.years):
+                lev = d.lev[iy]
+                cP = 0.0
+                if td.is_cap:
+                    for yp in range(y - td.lt, y + 1):
+                        if yp in td.fix_cap:
+                            if yp < d.start_of_scenario:
+                                c0 += td.hist_inv.get(yp - 1, 0) * td.fix_cap[yp] * lev
+                            else:
+                                c[Inv[k, yp - d.start_of_scenario]] += td.fix_cap[yp] * lev
+                else:
+                    cP = td.fix_dep[iy]
+                c[P[k, iy]] += (cP + td.fix_om_mi[iy]) * lev
+                c[Dec[k, iy]] += td.deco_cost * lev
+
+            # Residual value of the last investments (remaining lifetime fraction)
+            for iy, y in enumerate(d.years[:-1]):
+                if td.P_is_var[iy]:
+                    remaining = max(0, td.lt - (d.years.stop - 1 - y))
+                    c[Inv[k, iy + 1]] -= remaining / td.lt * d.lev[ny - 1]
+        return c, c0
+
+    def update_objective(self):
+        """Recompute c and c0 after the ModelData costs changed; return the columns whose coefficient changed."""
+        c, c0 = self.objective()
+        changed = np.flatnonzero(c != self.c)
+        self.c, self.c0 = c, c0
+        return changed
+
+    def update_constraints(self):
+        """Reassemble the constraint blocks after the ModelData changed, keeping the structure.
+
+        Only right-hand sides may change; returns {block number: changed rows}. Raises ValueError if
+        the blocks or their coefficients differ (e.g. a capacity becomes endogenous), which needs a
+        new LinearProgram.
+        """
+        old, self.blocks = self.blocks, []
+        try:
+            self._build_constraints()
+        finally:
+            new, self.blocks = self.blocks, old
+        if [(b.family, b.sense, b.techno) for b in new] != [(b.family, b.sense, b.techno) for b in old]:
+            raise ValueError('Constraint blocks changed: build a new LinearProgram')
+        changed = {}
+        for n, (ob, nb) in enumerate(zip(old, new)):
+            if ob.A.shape != nb.A.shape or (ob.A != nb.A).nnz:
+                raise ValueError(f'Coefficients of constraint block {n} ({nb.family}) changed: build a new LinearProgram')
+            rows = np.flatnonzero(ob.rhs != nb.rhs)
+            if rows.size:
+                ob.rhs = nb.rhs
+                changed[n] = rows
+        return changed
+
+# --------------------- GET methods -----------------------------------------------------------------------------------
+
+    def get_families(self):
+        """Constraint families in build order."""
+        return list(dict.fromkeys(b.family for b in self.blocks))
+
+    def n_constraints(self):
+        return sum(len(b) for b in self.blocks)
+
+    def to_sparse(self):
+        """All constraints as (A_ub, b_ub, A_eq, b_eq), 'ge' rows negated into 'le' rows."""
+        ub = [b.A if b.sense == 'le' else -b.A for b in self.blocks if b.sense != 'eq']
+        eq = [b.A for b in self.blocks if b.sense == 'eq']
+        stack = lambda parts: sp.vstack(parts, format='csr') if parts else sp.csr_matrix((0, self.n_vars))
+        b_ub, b_eq = self.rhs_vectors()
+        return stack(ub), b_ub, stack(eq), b_eq
+
+    def rhs_vectors(self):
+        """Right-hand sides (b_ub, b_eq) in the row order of to_sparse."""
+        ub = [b.rhs if b.sense == 'le' else -b.rhs for b in self.blocks if b.sense != 'eq']
+        eq = [b.rhs for b in self.blocks if b.sense == 'eq']
+        stack = lambda parts: np.concatenate(parts) if parts else np.zeros(0)
+        return stack(ub), stack(eq)
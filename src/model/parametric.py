@@ -0,0 +1,142 @@
+from .docplex_builder import DocplexBuilder
+from .highs_backend import HighsSolver
+from .lp import LinearProgram
+from .presolve import PresolvedProgram
+
+
+class ParametricModel:
+    """Model built once and updated in place for scenario sweeps.
+
+    Cost hypotheses (occ_*, cost_co2_*) only change objective coefficients, capacity hypotheses
+    (*_invest_max, nuclear_hist_lifetime) only change right-hand sides: ``update_costs`` and
+    ``update_bounds`` re-read them from the technos and push the coefficients that differ to the
+    solver model, which is then re-solved without being rebuilt (the HiGHS backend reuses the
+    matrices assembled once).
+
+    With ``presolve=True`` the updated LinearProgram is presolved again after each update and the
+    solver model is rebuilt on it (the reductions depend on the costs and bounds), so nothing is
+    updated in place.
+
+    Parameters
+    ----------
+    data : ModelData
+        Model data; updated in place by update_costs/update_bounds.
+    solver : str
+        'cplex' (docplex) or 'highs' (scipy).
+    presolve : bool
+        Solve a PresolvedProgram of the LinearProgram, presolved again after each update.
+    name : str
+        Name of the docplex model.
+    **options
+        HiGHS options (see HighsSolver).
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, data, solver='cplex', presolve=False, name='model', **options):
+
+        if isinstance(data, LinearProgram):
+            raise TypeError('ParametricModel is built from a ModelData, not a LinearProgram or PresolvedProgram: '
+                            'use presolve=True to solve a presolved program')
+        if solver not in ('cplex', 'highs'):
+            raise ValueError(f"Unknown solver {solver}: expected 'cplex' or 'highs'")
+        self.data     = data
+        self.lp       = LinearProgram(data)
+        self.solver   = solver
+        self.presolve = presolve
+        self.name     = name
+        self._options = options
+        self.prog     = None   # Program given to the solver (self.lp or its PresolvedProgram)
+        self._builder = None
+        self._highs   = None
+        self._build()
+        self.x               = None   # Last solution, in lp column order
+        self.objective_value = None
+        self.history         = []     # (objective value, solve time) of each solve
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def _build(self):
+        # Programme du solveur : lp, ou lp présolvé à nouveau (les réductions dépendent des coûts et des bornes)
+        self.prog = PresolvedProgram(self.lp) if self.presolve else self.lp
+        if self.solver == 'cplex':
+            if self._builder is not None:
+                self._builder.get_model().end()
+            self._builder = DocplexBuilder(self.prog, name=self.name)
+            self._builder.build(verbose=False)
+        else:
+            self._highs = HighsSolver(self.prog, **self._options)
+
+    def update_costs(self, techno):
+        """Re-read the costs of the technos ({index: Techno}); return the number of objective coefficients changed."""
+        for i, t in techno.items():
+            self.data.technos[self.data.position(i)].set_costs(t)
+        return self._update_objective()
+
+    def update_bounds(self, techno):
+        """Re-read capacity and energy limits of the technos ({index: Techno}); return the number of right-hand sides changed.
+
+        Raises ValueError if the change is structural (e.g. a capacity becomes endogenous): build a new model.
+        """
+        for i, t in techno.items():
+            self.data.technos[self.data.position(i)].set_capacity(t)
+        changed = self.lp.update_constraints()
+        cols = self.lp.update_objective()   # The residual value depends on the lifetimes
+        if self.presolve:
+            self._build()
+        elif self._builder is not None:
+            self._builder.update_rhs(changed)
+            self._builder.update_objective(cols)
+        else:
+            self._highs.update_rhs()
+        return sum(len(rows) for rows in changed.values())
+
+    def _update_objective(self):
+        cols = self.lp.update_objective()
+        if self.presolve:
+            self._build()
+        elif self._builder is not None:
+            self._builder.update_objective(cols)
+        return len(cols)
+
+    def solve(self, log_output=False):
+        """Solve the current model; return the solution in lp column order, or None if not optimal."""
+        if self._builder is not None:
+            model = self._builder.get_model()
+            solution = model.solve(log_output=log_output)
+            if solution is None:
+                return None
+            self.x = self._builder.solution_values(solution)
+            self.objective_value = model.objective_value
+            solve_time = model.solve_details.time
+        else:
+            if self._highs.solve(log_output=log_output) is None:
+                return None
+            self.x = self._highs.solution_values()
+            self.objective_value = self._highs.get_objective_value()
+            solve_time = self._highs.solve_time
+        if self.presolve:
+            self.x = self.prog.postsolve(self.x)
+        self.history.append((self.objective_value, solve_time))
+        return self.x
+
+    def column(self, family, i, *ywh):
+        """Column of variable family[i, y(, w, h)], keyed as the notebook dicts (y-1 for Inv and Dec)."""
+        d = self.data
+        years = d.inv_years if family in ('Inv', 'Dec') else d.years
+        pos = tuple(v - axis.start for v, axis in zip(ywh, (years, d.weeks, d.hours)))
+        return self.lp.columns[family][(d.position(i),) + pos]
+
+# --------------------- GET methods -----------------------------------------------------------------------------------
+
+    def get_model(self):
+        """docplex model (CPLEX) or HighsSolver (HiGHS)."""
+        return self._builder.get_model() if self._builder is not None else self._highs
+    def get_var(self, family):
+        """Notebook-style dict of docplex variables of a family (CPLEX only)."""
+        return self._builder.get_var(family)
+    def get_blocks(self, family, techno=None):
+        """Numbers of the constraint blocks of the solver model of a family, optionally of one techno."""
+        return [n for n, b in enumerate(self.prog.blocks) if b.family == family and (techno is None or b.techno == techno)]
+    def get_constraints(self, family, techno=None):
+        """docplex constraints of a family, optionally of one techno (CPLEX only)."""
+        cts = self._builder.get_constraints()
+        return [ct for n in self.get_blocks(family, techno) for ct in cts[n]]
@@ -0,0 +1,192 @@
+import numpy as np
+import scipy.sparse as sp
+
+from .lp import LinearProgram, ConstraintBlock, VAR_FAMILIES
+
+# Présolve du programme linéaire : les variables dont la valeur est imposée disparaissent du modèle
+#   - lignes à un seul terme : égalité -> variable fixée (P exogène, E exogène, SE == 0), inégalité -> borne (E >= 0)
+#   - lignes forcées : égalité atteinte seulement aux bornes (E + EC == LF*P avec LF == 0 -> E = EC = 0, PV la nuit)
+#   - colonnes vides : variable présente dans aucune ligne, fixée à sa borne la moins chère (EC hors fatal)
+# Les valeurs fixées sont reportées dans les seconds membres (bilan de demande) et la constante de l'objectif.
+# Les étapes sont répétées jusqu'à ce que plus rien ne change.
+
+
+class PresolvedProgram(LinearProgram):
+    """LinearProgram with its fixed and structurally zero columns folded into constants.
+
+    Behaves as a LinearProgram for DocplexBuilder and HighsSolver: ``columns[family]`` holds the
+    reduced column of each variable, or -1 if it was removed. ``postsolve`` expands a reduced
+    solution to the columns of the original program, for store_solution. The reductions depend on
+    the costs and bounds: after ``lp.update_objective``/``lp.update_constraints``, presolve the
+    updated ``lp`` again (as ParametricModel and RollingHorizon do).
+
+    Parameters
+    ----------
+    lp : LinearProgram
+        Program to reduce (left unchanged).
+    tol : float
+        Tolerance of the fixings and feasibility checks.
+    drop : float
+        Coefficients below this magnitude are structural zeros (load factors of ~1e-17 at dawn and dusk).
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, lp, tol=1e-9, drop=1e-12):
+
+        self.data     = lp.data
+        self.original = lp
+        self.tol      = tol
+
+        A = sp.vstack([b.A for b in lp.blocks], format='csr')
+        A.data[np.abs(A.data) < drop] = 0.0
+        A.eliminate_zeros()
+        rhs = np.concatenate([b.rhs for b in lp.blocks])
+        sense = np.concatenate([np.full(len(b), b.sense) for b in lp.blocks])
+        self._lb, self._ub = lp.lb.copy(), lp.ub.copy()
+        self._fixed = np.zeros(lp.n_vars, dtype=bool)
+        self._x = np.zeros(lp.n_vars)             # Values of the fixed columns
+        self._active = np.ones(A.shape[0], dtype=bool)
+        self._reduce(A, rhs, sense, lp.c)
+
+        # Reduced program
+        kept = np.flatnonzero(~self._fixed)
+        index = np.full(lp.n_vars, -1)
+        index[kept] = np.arange(len(kept))
+        self.kept    = kept
+        self.n_vars  = len(kept)
+        self.columns = {fam: index[lp.columns[fam]] for fam in VAR_FAMILIES}
+        self.lb, self.ub = self._lb[kept], self._ub[kept]
+        self.c  = lp.c[kept]
+        self.c0 = lp.c0 + float(lp.c[self._fixed] @ self._x[self._fixed])
+
+        residual = rhs - A @ self._x
+        A_kept = A[:, kept]
+        self.blocks, self.report = [], {'columns': {}, 'rows': {}}
+        start = 0
+        for b in lp.blocks:
+            stop = start + len(b)
+            rows = start + np.flatnonzero(self._active[start:stop])
+            if rows.size:
+                self.blocks.append(ConstraintBlock(b.family, b.sense, A_kept[rows], residual[rows], b.techno))
+            removed, total = self.report['rows'].get(b.family, (0, 0))
+            self.report['rows'][b.family] = (removed + len(b) - rows.size, total + len(b))
+            start = stop
+        for fam in VAR_FAMILIES:
+            cols = lp.columns[fam]
+            self.report['columns'][fam] = (int(self._fixed[cols].sum()), cols.size)
+        E = lp.columns['E']
+        self.report['E'] = {i: (int(self._fixed[E[k]].sum()), E[k].size) for k, i in enumerate(self.data.keys)}
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def _fix(self, cols, values):
+        # Fixe des colonnes libres ; une même colonne fixée deux fois doit l'être à la même valeur
+        if cols.size == 0:
+            return
+        tol = self.tol
+        order = np.argsort(cols, kind='stable')
+        cols, values = cols[order], values[order]
+        first = np.r_[True, cols[1:] != cols[:-1]]
+        group = np.cumsum(first) - 1
+        vmin = np.full(first.sum(), np.inf)
+        vmax = np.full(first.sum(), -np.inf)
+        np.minimum.at(vmin, group, values)
+        np.maximum.at(vmax, group, values)
+        cols = cols[first]
+        scale = 1 + np.abs(vmin)
+        if (vmax - vmin > tol * scale).any() or (vmin < self._lb[cols] - tol * scale).any() or (vmin > self._ub[cols] + tol * scale).any():
+            raise ValueError('Presolve: the program is infeasible (conflicting fixed values)')
+        self._x[cols] = np.clip(vmin, self._lb[cols], self._ub[cols])
+        self._fixed[cols] = True
+
+    def _reduce(self, A, rhs, sense, c):
+        tol = self.tol
+        is_le, is_ge, is_eq = sense == 'le', sense == 'ge', sense == 'eq'
+        while True:
+            free = ~self._fixed
+            Af = (A @ sp.diags(free.astype(float))).tocsr()
+            Af.eliminate_zeros()
+            residual = rhs - A @ self._x
+            nnz = np.diff(Af.indptr)
+
+            # Empty rows : only a feasibility check
+            empty = np.flatnonzero(self._active & (nnz == 0))
+            r = residual[empty]
+            scale = tol * (1 + np.abs(rhs[empty]))
+            if ((is_eq[empty] & (np.abs(r) > scale)) | (is_le[empty] & (r < -scale)) | (is_ge[empty] & (r > scale))).any():
+                raise ValueError('Presolve: the program is infeasible (empty row violated)')
+            self._active[empty] = False
+
+            # Singleton rows : fixing (eq) or bound (le/ge)
+            single = np.flatnonzero(self._active & (nnz == 1))
+            if single.size:
+                col, a = Af.indices[Af.indptr[single]], Af.data[Af.indptr[single]]
+                v = residual[single] / a
+                eq = is_eq[single]
+                upper = ~eq & (is_le[single] == (a > 0))
+                lower = ~eq & ~upper
+                np.minimum.at(self._ub, col[upper], v[upper])
+                np.maximum.at(self._lb, col[lower], v[lower])
+                if (self._lb > self._ub + tol * (1 + np.abs(self._ub))).any():
+                    raise ValueError('Presolve: the program is infeasible (crossed bounds)')
+                if eq.any():
+                    self._fix(col[eq], v[eq])
+                self._active[single] = False
+                self._fix_tight_bounds()
+                continue
+
+            # Forcing rows : the right-hand side is only reached with every variable at its bound
+            Apos, Aneg = Af.maximum(0), Af.minimum(0)
+            lb, ub = self._lb, self._ub
+            fin_lb, fin_ub = np.where(np.isfinite(lb), lb, 0.0), np.where(np.isfinite(ub), ub, 0.0)
+            Ppos, Pneg = (Apos != 0).astype(float), (Aneg != 0).astype(float)
+            inf_min = Ppos @ np.isinf(lb) + Pneg @ np.isinf(ub)   # Infinite bounds in the minimum activity
+            inf_max = Ppos @ np.isinf(ub) + Pneg @ np.isinf(lb)
+            act_min = Apos @ fin_lb + Aneg @ fin_ub
+            act_max = Apos @ fin_ub + Aneg @ fin_lb
+            scale = tol * (1 + np.abs(residual))
+            at_min = self._active & (inf_min == 0) & (is_eq | is_le) & (np.abs(act_min - residual) <= scale)
+            at_max = self._active & (inf_max == 0) & (is_eq | is_ge) & (np.abs(act_max - residual) <= scale) & ~at_min
+            if at_min.any() or at_max.any():
+                for rows, low_if_pos in ((np.flatnonzero(at_min), True), (np.flatnonzero(at_max), False)):
+                    sub = Af[rows]
+                    cols = sub.indices
+                    to_lb = (sub.data > 0) == low_if_pos
+                    self._fix(cols, np.where(to_lb, lb[cols], ub[cols]))
+                self._active[at_min | at_max] = False
+                continue
+
+            # Empty columns : fixed at their cheapest finite bound
+            used = np.zeros(A.shape[1], dtype=bool)
+            used[Af[np.flatnonzero(self._active)].indices] = True
+            value = np.where(c > 0, lb, np.where(c < 0, ub, np.where(np.isfinite(lb), lb, ub)))
+            unused = np.flatnonzero(free & ~used & np.isfinite(value))
+            if unused.size:
+                self._fix(unused, value[unused])
+            return
+
+    def _fix_tight_bounds(self):
+        tight = np.flatnonzero(~self._fixed & (self._ub - self._lb <= self.tol * (1 + np.abs(self._lb))))
+        if tight.size:
+            self._fix(tight, self._lb[tight])
+
+    def postsolve(self, x):
+        """Solution of the original program (its column order) from a solution x of the reduced one."""
+        full = self._x.copy()
+        full[self.kept] = x
+        return full
+
+    def print_report(self):
+        print('-' * 50)
+        print(f"{'Columns':<20}{'Removed':>10}{'Total':>10}{'%':>8}")
+        for fam, (n, tot) in self.report['columns'].items():
+            print(f"{fam:<20}{n:>10}{tot:>10}{100 * n / max(tot, 1):>8.1f}")
+        print(f"{'Rows':<20}{'Removed':>10}{'Total':>10}{'%':>8}")
+        for fam, (n, tot) in self.report['rows'].items():
+            print(f"{fam:<20}{n:>10}{tot:>10}{100 * n / max(tot, 1):>8.1f}")
+        print(f"{'E by techno':<20}{'Removed':>10}{'Total':>10}{'%':>8}")
+        for k, (i, (n, tot)) in enumerate(self.report['E'].items()):
+            td = self.data.technos[k]
+            print(f"{td.name + '/' + td.title:<20}{n:>10}{tot:>10}{100 * n / max(tot, 1):>8.1f}")
+        print(f"{'Total':<20}{self.original.n_vars - self.n_vars:>10} columns, "
+              f"{self.original.n_constraints() - self.n_constraints()} rows removed")
+        print('-' * 50)
@@ -0,0 +1,149 @@
+import time
+
+import numpy as np
+
+from .docplex_builder import DocplexBuilder
+from .highs_backend import HighsSolver
+from .lp import LinearProgram
+from .presolve import PresolvedProgram
+from .solution import store_values
+
+# Horizon glissant (myope) : fenêtres de `window` années, décalées de window - overlap années
+# Seules les premières années de chaque fenêtre sont retenues ; elles deviennent l'historique de la fenêtre suivante :
+#   - capacité installée à la veille de la fenêtre (hist_capa)
+#   - investissements et déclassements retenus (hist_inv, hist_dec) : déclassement des millésimes, annuités
+#   - niveau de stockage de la dernière semaine retenue et production de la dernière heure (rampes)
+# Le niveau reporté à la fenêtre suivante est borné dans chaque fenêtre qui a une suivante (lignes terminales).
+
+
+class RollingHorizon:
+    """Myopic solve of a ModelData over windows of years.
+
+    Each window is solved alone (its own LinearProgram and solver model, freed afterwards) and its
+    first ``window - overlap`` years are committed; the last window commits all its years. The
+    committed capacities, investments, decommissionings, storage level and last-hour energy are
+    the history of the next window, so the committed pathway is feasible for the full problem.
+
+    Parameters
+    ----------
+    data : ModelData
+        Model data over the full horizon.
+    window : int
+        Years per window.
+    overlap : int
+        Years shared by two consecutive windows (re-optimised by the later one).
+    solver : str
+        'cplex' (docplex) or 'highs' (scipy).
+    presolve : bool
+        Presolve each window (PresolvedProgram).
+    name : str
+        Prefix of the docplex model names.
+    **options
+        HiGHS options (see HighsSolver).
+    """
+# --------------------- Constructor ----------------------------------------------------------------------------------
+    def __init__(self, data, window, overlap=0, solver='highs', presolve=True, name='model', **options):
+
+        if not 0 <= overlap < window:
+            raise ValueError('overlap must be in [0, window)')
+        if solver not in ('cplex', 'highs'):
+            raise ValueError(f"Unknown solver {solver}: expected 'cplex' or 'highs'")
+        self.data     = data
+        self.window   = window
+        self.overlap  = overlap
+        self.solver   = solver
+        self.presolve = presolve
+        self.name     = name
+        self._options = options
+        self.values   = None   # Committed solution over the full horizon {'P': [nt, ny], ..., 'E': [nt, ny, nw, nh]}
+        self.windows  = []     # (window years, committed years, objective value, solve time) of each window
+
+# --------------------- End Of Constructor ----------------------------------------------------------------------------
+
+    def get_windows(self):
+        """(window years, committed years) of each window."""
+        years, step = self.data.years, self.window - self.overlap
+        out = []
+        for y0 in range(years.start, years.stop, step):
+            stop = min(y0 + self.window, years.stop)
+            out.append((range(y0, stop), range(y0, stop if stop == years.stop else y0 + step)))
+            if stop == years.stop:
+                break
+        return out
+
+    def _solve_window(self, lp, y0, log_output):
+        prog = PresolvedProgram(lp) if self.presolve else lp
+        start = time.perf_counter()
+        if self.solver == 'highs':
+            highs = HighsSolver(prog, **self._options)
+            if highs.solve(log_output=log_output) is None:
+                raise RuntimeError(f'No solution for the window starting in {y0}: {highs.get_status()}')
+            x, objective = highs.solution_values(), highs.get_objective_value()
+        else:
+            builder = DocplexBuilder(prog, name=f'{self.name}_{y0}')
+            model = builder.build(verbose=False)
+            solution = model.solve(log_output=log_output)
+            if solution is None:
+                raise RuntimeError(f'No solution for the window starting in {y0}: {model.solve_details.status}')
+            x, objective = builder.solution_values(solution), model.objective_value
+            model.end()
+        x = prog.postsolve(x) if self.presolve else x
+        return x, objective, time.perf_counter() - start
+
+    def solve(self, log_output=False):
+        """Solve every window in turn; return the committed values over the full horizon."""
+        d = self.data
+        nt = len(d.keys)
+        self.values = {fam: np.zeros((nt, len(d.years))) for fam in ('P', 'Inv', 'Dec')}
+        self.values.update({fam: np.zeros((nt,) + d.shape) for fam in ('E', 'EC', 'SE')})
+        self.windows = []
+        carry = None   # Window data of the previous window, with its committed values
+        for years, committed in self.get_windows():
+            wd = d.window(years)
+            if carry is not None:
+                self._set_history(wd, *carry)
+            if years.stop != d.years.stop:
+                for td in wd.technos:
+                    if td.storage is not None:
+                        td.storage['terminal'] = True
+            lp = LinearProgram(wd)
+            x, objective, solve_time = self._solve_window(lp, years.start, log_output)
+
+            n = len(committed)
+            iy = slice(committed.start - d.years.start, committed.stop - d.years.start)
+            for fam, values in self.values.items():
+                values[:, iy] = x[lp.columns[fam]][:, :n]
+            carry = (wd, {fam: x[lp.columns[fam]][:, :n] for fam in self.values}, committed)
+            self.windows.append((years, committed, objective, solve_time))
+            del lp, x
+        return self.values
+
+    def _set_history(self, wd, prev, values, committed):
+        # Historique de la fenêtre wd : décisions retenues de la fenêtre précédente (prev)
+        last = len(committed) - 1
+        for k, (td, pd) in enumerate(zip(wd.technos, prev.technos)):
+            td.hist_inv, td.hist_dec = dict(pd.hist_inv), dict(pd.hist_dec)
+            for n, y in enumerate(committed):
+                td.hist_inv[y - 1] = values['Inv'][k, n]
+                td.hist_dec[y - 1] = values['Dec'][k, n]
+            td.hist_capa = dict(pd.hist_capa)
+            td.hist_capa[committed.stop - 1] = values['P'][k, last]
+            # Rampe depuis la dernière heure retenue (si elle était une variable)
+            if pd.E_is_var[last].ravel()[-1]:
+                td.ramp_from = values['E'][k, last].ravel()[-1]
+            if td.storage is not None:
+                se = values['SE'][k, last]
+                td.storage['carry'] = (se[-1, -1], se[-1, 0], wd.weights[-1])
+
+    def store(self, techno, years_world):
+        """Write the committed pathway into the technos (same structures as a full solve, see store_solution)."""
+        if self.values is None:
+            raise RuntimeError('No solution available: run solve() first')
+        store_values(techno, self.data, self.values, years_world)
+
+    def print_windows(self):
+        print('-' * 50)
+        print(f"{'Window':<14}{'Committed':<14}{'Objective (€)':>14}{'Time (s)':>10}")
+        for years, committed, objective, solve_time in self.windows:
+            print(f"{years.start}-{years.stop - 1:<9}{committed.start}-{committed.stop - 1:<9}{objective:>14.3e}{solve_time:>10.2f}")
+        print('-' * 50)
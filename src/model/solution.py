@@ -0,0 +1,66 @@
+def store_solution(techno, lp, x, years_world):
+    """Write a solution vector back into the techno objects.
+
+    Capacity, investment and decommissioning are stored over years_world (historic data before
+    the scenario, solution values after), energy through ``set_E`` and storage levels through
+    the storage spec ``set_level``, as expected by plot_output.
+
+    Parameters
+    ----------
+    techno : dict[int, Techno]
+        Technologies of the scenario.
+    lp : LinearProgram
+        Program the solution belongs to.
+    x : np.ndarray
+        Values of all variables, in lp column order.
+    years_world : range
+        Full year axis of the capacity series.
+    """
+    values = {fam: x[lp.columns[fam]] for fam in ('P', 'Inv', 'Dec', 'E', 'SE')}
+    store_values(techno, lp.data, values, years_world)
+
+
+def store_values(techno, data, values, years_world):
+    """Write solution arrays back into the techno objects (see store_solution).
+
+    Parameters
+    ----------
+    techno : dict[int, Techno]
+        Technologies of the scenario.
+    data : ModelData
+        Model data the arrays are aligned on.
+    values : dict[str, np.ndarray]
+        'P', 'Inv', 'Dec' [n_techno, n_years] and 'E', 'SE' [n_techno, n_years, n_weeks, n_hours].
+    years_world : range
+        Full year axis of the capacity series.
+    """
+    d = data
+    start = d.start_of_scenario
+    P, Inv, Dec, E, SE = (values[fam] for fam in ('P', 'Inv', 'Dec', 'E', 'SE'))
+
+    for k, i in enumerate(d.keys):
+        t = techno[i]
+        tec = t.get_tech()
+        hist_capa = tec.get_historic_data('CAPA') or {}
+        hist_inv = tec.get_historic_data('INV') or {}
+        hist_dec = tec.get_historic_data('DEC') or {}
+        P_sol, Dec_sol, Inv_sol = {}, {}, {}
+        for y in years_world[1:]:
+            if y < start:
+                if y in hist_capa:
+                    P_sol[y] = hist_capa[y]
+                if y - 1 in hist_dec:
+                    Dec_sol[y - 1] = hist_dec[y - 1]
+                if y - 1 in hist_inv:
+                    Inv_sol[y - 1] = hist_inv[y - 1]
+            elif y in d.years:
+                iy = y - start
+                P_sol[y] = P[k, iy].item()
+                Dec_sol[y - 1] = Dec[k, iy].item()
+                Inv_sol[y - 1] = Inv[k, iy].item()
+        if t.get_type() == 'storage':
+            t.get_spec().set_level(SE[k])
+        tec.set_P(P_sol)
+        tec.set_Dec(Dec_sol)
+        tec.set_Inv(Inv_sol)
+        tec.set_E(E[k])